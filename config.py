@@ -8,8 +8,8 @@ load_dotenv()
 
 # --- HIGH-DPI & UI STABILITY ---
 # Forces the OS to handle scaling correctly so buttons don't get cut off
-os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
-os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
+os.environ.setdefault("QT_AUTO_SCREEN_SCALE_FACTOR", "1")
+os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
 
 # --- ROBUST LOGGING CONFIGURATION ---
 class SafeStreamHandler(logging.StreamHandler):
@@ -23,6 +23,10 @@ class SafeStreamHandler(logging.StreamHandler):
             self.flush()
 
 log_format = '%(asctime)s | %(levelname)s | [%(name)s] | %(message)s'
+# The format never shows thread/process fields: skip collecting them for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 date_format = '%Y-%m-%d %H:%M:%S'
 formatter = logging.Formatter(log_format, datefmt=date_format)
 
@@ -59,6 +63,14 @@ class Config:
     STRICT_AUTONOMY_MODE = True 
     AUTO_APPROVAL = True
     PRIORITIZE_VERIFIED_SITES = True
+
+    # --- PROJECT SPECIFIC PRIORITY MAP ---
+    PROJECT_URL = "https://roshan-chaudhary13.github.io/rio_finance_bank/"
+    PRIORITY_KEYWORDS = frozenset({
+        "bill", "electricity", "gold", "profile", "login",
+        "bank", "rio", "loan", "account", "transfer", "pay",
+        "balance", "statement", "credit", "debit"
+    })
     
     # --- KINETIC & BROWSER SETTINGS ---
     VIEWPORT_WIDTH = 1920
@@ -66,7 +78,44 @@ class Config:
     
     HEADLESS = os.getenv("HEADLESS_MODE", "False").lower() == "true"
     BROWSER_TYPE = "playwright"
+    CONTEXT_POOL_SIZE = 2  # Warm spare browser contexts kept for crash recovery
+    # Launched Chromium processes shared across ArvynBrowser sessions (see tools.browser.BrowserPool)
+    POOL_MIN_SIZE = int(os.getenv("BROWSER_POOL_MIN", "0"))  # Kept warm even when idle
+    POOL_MAX_SIZE = int(os.getenv("BROWSER_POOL_MAX", "2"))  # Idle browsers retained for reuse
+    POOL_IDLE_TIMEOUT = 300  # Seconds before an idle browser above the minimum is closed
+    # Concurrent sessions share one Chromium and isolate via their own contexts
+    SHARE_BROWSER = os.getenv("BROWSER_SHARE", "True").lower() == "true"
+    # Opt-in cookie/localStorage snapshot restored on start and saved on close (skips re-login).
+    # Holds live session tokens: leave unset unless the machine is trusted.
+    STORAGE_STATE_PATH = os.getenv("BROWSER_STORAGE_STATE") or None
+    # Third-party ads/analytics aborted at the network layer (first-party assets are never touched)
+    BLOCK_TRACKERS = os.getenv("BLOCK_TRACKERS", "True").lower() == "true"
+    BLOCKED_DOMAINS = (
+        "doubleclick.net", "googlesyndication.com", "googletagmanager.com", "google-analytics.com",
+        "googleadservices.com", "facebook.net", "hotjar.com", "clarity.ms", "scorecardresearch.com",
+        "adnxs.com", "taboola.com", "outbrain.com", "criteo.com", "amazon-adsystem.com"
+    )
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    # Static Chromium flags (window size is derived from the viewport at launch)
+    BROWSER_LAUNCH_ARGS = (
+        "--disable-blink-features=AutomationControlled",
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-web-security",
+        "--force-device-scale-factor=1",
+        "--high-dpi-support=1",
+        "--force-color-profile=srgb"
+    )
     SCREENSHOT_PATH = "screenshots"
+    # Persist every VLM frame to SCREENSHOT_PATH (off by default: frames stay in memory)
+    DEBUG_SCREENSHOTS = os.getenv("DEBUG_SCREENSHOTS", "False").lower() == "true"
+    MAX_CACHED_FRAMES = 8  # Frames held between ArvynBrowser.capture() and release()
+    # VLM frame encoding: JPEG is ~10x smaller than PNG and reads the same to the model
+    SCREENSHOT_FORMAT = os.getenv("VLM_IMAGE_FORMAT", "jpeg").lower()
+    SCREENSHOT_QUALITY = 70  # JPEG only; ignored for PNG
+    # Longest edge of frames sent to the VLM (0 = native). Grounding uses 0-1000 normalized
+    # coordinates, so downscaling does not affect click translation.
+    SCREENSHOT_MAX_DIM = 1024
     
     # --- DATA & MEMORY STORAGE ---
     USER_PROFILE_PATH = "data/user_profile.json"
@@ -75,7 +124,10 @@ class Config:
     # --- VOICE & INTERACTION ---
     DEFAULT_VOICE_ID = None  
     STT_ENERGY_THRESHOLD = 300 
+    STT_PARTIAL_MAX_CHUNKS = 6  # Interim passes stop past this many phrases; the final pass covers the rest
     COMMAND_TIMEOUT = 45 
+    INTENT_CACHE_SIZE = 64  # Parsed intents kept per session (0 disables the cache)
+    SHUTDOWN_WATCHDOG_MS = 5000  # Interval for reporting worker threads that are slow to exit
     
     # --- UI SETTINGS ---
     THEME = "GlassMorphism_V2"
@@ -121,15 +173,36 @@ QUBRID_BASE_URL = Config.QUBRID_BASE_URL
 QUBRID_MODEL_NAME = Config.QUBRID_MODEL_NAME
 
 SCREENSHOT_PATH = Config.SCREENSHOT_PATH
+DEBUG_SCREENSHOTS = Config.DEBUG_SCREENSHOTS
+MAX_CACHED_FRAMES = Config.MAX_CACHED_FRAMES
+SCREENSHOT_FORMAT = Config.SCREENSHOT_FORMAT
+SCREENSHOT_QUALITY = Config.SCREENSHOT_QUALITY
+SCREENSHOT_MAX_DIM = Config.SCREENSHOT_MAX_DIM
 USER_PROFILE_PATH = Config.USER_PROFILE_PATH
 DEFAULT_VOICE_ID = Config.DEFAULT_VOICE_ID
 COMMAND_TIMEOUT = Config.COMMAND_TIMEOUT
+STT_PARTIAL_MAX_CHUNKS = Config.STT_PARTIAL_MAX_CHUNKS
+INTENT_CACHE_SIZE = Config.INTENT_CACHE_SIZE
+SHUTDOWN_WATCHDOG_MS = Config.SHUTDOWN_WATCHDOG_MS
 VIEWPORT_WIDTH = Config.VIEWPORT_WIDTH
 VIEWPORT_HEIGHT = Config.VIEWPORT_HEIGHT
+HEADLESS = Config.HEADLESS
+USER_AGENT = Config.USER_AGENT
+BROWSER_LAUNCH_ARGS = Config.BROWSER_LAUNCH_ARGS
+CONTEXT_POOL_SIZE = Config.CONTEXT_POOL_SIZE
+POOL_MIN_SIZE = Config.POOL_MIN_SIZE
+POOL_MAX_SIZE = Config.POOL_MAX_SIZE
+POOL_IDLE_TIMEOUT = Config.POOL_IDLE_TIMEOUT
+SHARE_BROWSER = Config.SHARE_BROWSER
+STORAGE_STATE_PATH = Config.STORAGE_STATE_PATH
+BLOCK_TRACKERS = Config.BLOCK_TRACKERS
+BLOCKED_DOMAINS = Config.BLOCKED_DOMAINS
 
 # Export Autonomous Flags
 STRICT_AUTONOMY_MODE = Config.STRICT_AUTONOMY_MODE
 AUTO_APPROVAL = Config.AUTO_APPROVAL
+PROJECT_URL = Config.PROJECT_URL
+PRIORITY_KEYWORDS = Config.PRIORITY_KEYWORDS
 
 # Trigger validation on import
 Config.validate()
\ No newline at end of file
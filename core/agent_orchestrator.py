@@ -12,11 +12,13 @@ from config import (
     QUBRID_MODEL_NAME, 
     VIEWPORT_WIDTH, 
     VIEWPORT_HEIGHT,
-    DASHBOARD_SIZE
+    DASHBOARD_SIZE,
+    HEADLESS,
+    STORAGE_STATE_PATH
 )
 from core.state_schema import AgentState
 from core.qwen_logic import QwenBrain
-from tools.browser import ArvynBrowser
+from tools.browser import ArvynBrowser, BrowserPool
 from tools.data_store import ProfileManager
 from tools.voice import ArvynVoice
 from core.session_manager import SessionManager
@@ -31,7 +33,7 @@ class ArvynOrchestrator:
 
     def __init__(self, model_name: str = QUBRID_MODEL_NAME):
         self.brain = QwenBrain(model_name=model_name)
-        self.browser = ArvynBrowser(headless=False)
+        self.browser = ArvynBrowser(headless=HEADLESS, storage_state=STORAGE_STATE_PATH)
         self.profile = ProfileManager()
         self.voice = ArvynVoice()
         self.sessions = SessionManager()
@@ -72,8 +74,14 @@ class ArvynOrchestrator:
             self._add_to_session_log("system", "Deactivating hardened kinetic layer...")
             try:
                 await self.browser.close()
+                # Pooled Chromium processes outlive sessions: terminate them with the worker
+                await BrowserPool.shutdown_all()
             except Exception as e:
                 logger.error(f"Cleanup Error: {e}")
+        try:
+            await self.brain.aclose()
+        except Exception as e:
+            logger.error(f"Cleanup Error: {e}")
 
     def _create_workflow(self) -> StateGraph:
         """Defines the interaction loop: Discovery -> Observe -> Reason -> Act."""
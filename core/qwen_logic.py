@@ -3,10 +3,12 @@ import json
 import logging
 import asyncio
 import re
+import hashlib
 import httpx
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List, Union
 
-from config import QUBRID_API_KEY, QUBRID_MODEL_NAME, QUBRID_BASE_URL, logger
+from config import QUBRID_API_KEY, QUBRID_MODEL_NAME, QUBRID_BASE_URL, INTENT_CACHE_SIZE, SCREENSHOT_FORMAT, logger
 from core.state_schema import IntentOutput, VisualGrounding
 
 class QwenBrain:
@@ -26,8 +28,27 @@ class QwenBrain:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        # Intent parses are deterministic (temperature 0): repeat commands skip the round-trip
+        self._intent_cache: "OrderedDict[str, IntentOutput]" = OrderedDict()
+        # Created lazily so it binds to the worker's event loop
+        self._client: Optional[httpx.AsyncClient] = None
         logger.info(f"[BRAIN] Qubrid Precision Engine v5.0 active: {self.model_name}")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client: TCP/TLS setup is paid once per session, not per call."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=160.0,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4)
+            )
+        return self._client
+
+    async def aclose(self):
+        """Releases pooled connections; called from the orchestrator's cleanup."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def _clean_json_response(self, raw_text: Any) -> str:
         """Robust JSON extraction with deep type-safety for Qwen/VL output."""
         try:
@@ -50,64 +71,79 @@ class QwenBrain:
 
     async def _call_with_retry(self, prompt: str, image_data: Optional[str] = None, retries: int = 4):
         """Advanced API caller with Dynamic Backoff, Precision Tuning, and Timeout handling."""
-        async with httpx.AsyncClient(timeout=160.0) as client:
-            for attempt in range(retries):
-                try:
-                    # Construct multimodal payload compatible with Qwen-VL architecture
-                    content = [{"type": "text", "text": prompt}]
-                    
-                    # Validate Image Data
-                    if image_data:
-                        if len(image_data) > 100: # Simple sanity check for valid base64 length
-                            content.append({
-                                "type": "image_url",
-                                "image_url": {"url": f"data:image/png;base64,{image_data}"}
-                            })
-                        else:
-                            logger.warning("[BRAIN] Screenshot data appears invalid/empty. sending text-only request.")
-                    
-                    messages = [{"role": "user", "content": content}]
-                    payload = {
-                        "model": self.model_name,
-                        "messages": messages,
-                        "temperature": 0.0, # CRITICAL: Locked for absolute coordinate stability
-                        "max_tokens": 4096 if image_data else 1024,
-                        "stream": False,
-                        "top_p": 0.1 # Enhanced focus on highest probability tokens
-                    }
-                    
-                    response = await client.post(self.base_url, headers=self.headers, json=payload)
-                    
-                    if response.status_code == 429:
-                        wait_time = (2 ** attempt) * 15 
-                        logger.warning(f"[QUOTA] Rate limit hit on {self.model_name}. Cooling down for {wait_time}s...")
-                        await asyncio.sleep(wait_time)
-                        continue
-                        
-                    if response.is_error:
-                        error_body = response.text
-                        logger.error(f"[API ERROR] Status: {response.status_code}, Body: {error_body}")
-                        response.raise_for_status()
-
-                    data = response.json()
-                    
-                    if 'choices' in data and len(data['choices']) > 0:
-                        result = data['choices'][0]['message']['content']
-                        if not result: raise ValueError("Received empty content string from Qubrid.")
-                        return result
+        client = self._get_client()
+        for attempt in range(retries):
+            try:
+                # Construct multimodal payload compatible with Qwen-VL architecture
+                content = [{"type": "text", "text": prompt}]
+                
+                # Validate Image Data
+                if image_data:
+                    if len(image_data) > 100: # Simple sanity check for valid base64 length
+                        content.append({
+                            "type": "image_url",
+                            "image_url": {"url": f"data:image/{SCREENSHOT_FORMAT};base64,{image_data}"}
+                        })
                     else:
-                        raise ValueError(f"Unexpected response payload format: {data}")
+                        logger.warning("[BRAIN] Screenshot data appears invalid/empty. sending text-only request.")
+                
+                messages = [{"role": "user", "content": content}]
+                payload = {
+                    "model": self.model_name,
+                    "messages": messages,
+                    "temperature": 0.0, # CRITICAL: Locked for absolute coordinate stability
+                    "max_tokens": 4096 if image_data else 1024,
+                    "stream": False,
+                    "top_p": 0.1 # Enhanced focus on highest probability tokens
+                }
+                
+                response = await client.post(self.base_url, headers=self.headers, json=payload)
+                
+                if response.status_code == 429:
+                    wait_time = (2 ** attempt) * 15 
+                    logger.warning(f"[QUOTA] Rate limit hit on {self.model_name}. Cooling down for {wait_time}s...")
+                    await asyncio.sleep(wait_time)
+                    continue
                     
-                except Exception as e:
-                    if attempt == retries - 1:
-                        logger.error(f"[ERROR] Precision API failure after {retries} retries: {e}")
-                        raise e
-                    wait = 4 + (attempt * 2)
-                    logger.warning(f"[RETRY] Precision Sync Attempt {attempt+1} failed. Re-syncing in {wait}s...")
-                    await asyncio.sleep(wait)
+                if response.is_error:
+                    error_body = response.text
+                    logger.error(f"[API ERROR] Status: {response.status_code}, Body: {error_body}")
+                    response.raise_for_status()
+
+                data = response.json()
+                
+                if 'choices' in data and len(data['choices']) > 0:
+                    result = data['choices'][0]['message']['content']
+                    if not result: raise ValueError("Received empty content string from Qubrid.")
+                    return result
+                else:
+                    raise ValueError(f"Unexpected response payload format: {data}")
+                
+            except Exception as e:
+                if attempt == retries - 1:
+                    logger.error(f"[ERROR] Precision API failure after {retries} retries: {e}")
+                    raise e
+                wait = 4 + (attempt * 2)
+                logger.warning(f"[RETRY] Precision Sync Attempt {attempt+1} failed. Re-syncing in {wait}s...")
+                await asyncio.sleep(wait)
+
+    def _intent_key(self, user_input: str) -> str:
+        normalized = " ".join(user_input.split())
+        return hashlib.blake2b(f"{self.model_name}|{normalized}".encode(), digest_size=16).hexdigest()
 
     async def parse_intent(self, user_input: str) -> IntentOutput:
-        """High-Fidelity Intent Extraction for specialized Autonomous Banking flows."""
+        """
+        High-Fidelity Intent Extraction for specialized Autonomous Banking flows.
+        UPGRADED: Successful parses are memoized (LRU) so repeated tasks skip the VLM call.
+        """
+        key = self._intent_key(user_input)
+        cached = self._intent_cache.get(key)
+        if cached is not None:
+            self._intent_cache.move_to_end(key)
+            logger.info("[BRAIN] Intent cache hit: %s", cached.action)
+            # Callers may mutate the result; never hand out the cached instance
+            return cached.model_copy(deep=True)
+
         prompt = f"""
         TASK: High-Precision Intent Parsing for Autonomous Banking Systems.
         USER COMMAND: "{user_input}"
@@ -143,11 +179,17 @@ class QwenBrain:
         try:
             raw_response = await self._call_with_retry(prompt)
             data = json.loads(self._clean_json_response(raw_response))
-            return IntentOutput(**data)
+            intent = IntentOutput(**data)
         except Exception as e:
             logger.error(f"[ERROR] Intent Parser Logic Fault: {e}")
             return IntentOutput(action="NAVIGATE", provider="Search", target="GENERAL", reasoning="Emergency intent recovery.")
 
+        if INTENT_CACHE_SIZE > 0:
+            self._intent_cache[key] = intent.model_copy(deep=True)
+            if len(self._intent_cache) > INTENT_CACHE_SIZE:
+                self._intent_cache.popitem(last=False)
+        return intent
+
     async def analyze_page_for_action(
         self, 
         screenshot_b64: str, 
@@ -1,10 +1,14 @@
-import base64
+try:
+    # SIMD (libbase64) codec with the stdlib's API; large screenshot frames encode/decode much faster
+    import pybase64 as base64
+except ImportError:
+    import base64
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QPushButton, QTextEdit, QStackedWidget, QFrame, QScrollArea
 )
-from PyQt6.QtCore import pyqtSignal, Qt, QSize
-from PyQt6.QtGui import QIcon, QPixmap, QImage, QColor
+from PyQt6.QtCore import pyqtSignal, Qt, QSize, QBuffer, QByteArray
+from PyQt6.QtGui import QIcon, QPixmap, QImage, QImageReader, QColor
 
 from config import (
     DASHBOARD_SIZE, 
@@ -261,6 +265,17 @@ class ArvynDashboard(QFrame):
         Superior Semantic Log Streaming (v4.8).
         IMPROVED: Added 'precision' and 'discovery' categories for Multi-Layer tracking.
         """
+        self.append_logs([(text, category)])
+
+    def append_logs(self, entries):
+        """Renders a batch of (text, category) entries with a single append and scroll."""
+        if not entries:
+            return
+        self.log_area.append("".join(self._format_log_entry(text, category) for text, category in entries))
+        self.log_area.verticalScrollBar().setValue(self.log_area.verticalScrollBar().maximum())
+
+    def _format_log_entry(self, text: str, category: str) -> str:
+        """Categorizes a log line and returns its HTML fragment."""
         colors = {
             "action": ACCENT_COLOR,
             "system": "#999999",
@@ -295,23 +310,25 @@ class ArvynDashboard(QFrame):
             "discovery": "🌐"
         }
         prefix = prefixes.get(category, "&gt;")
-        formatted_text = f"<div style='margin-bottom: 5px;'><span style='color:{color}; font-weight:900;'>{prefix}</span> {text}</div>"
-        
-        self.log_area.append(formatted_text)
-        self.log_area.verticalScrollBar().setValue(self.log_area.verticalScrollBar().maximum())
+        return f"<div style='margin-bottom: 5px;'><span style='color:{color}; font-weight:900;'>{prefix}</span> {text}</div>"
 
     def update_screenshot(self, b64_data: str):
         """Refreshes the precision visual monitor and status text."""
         try:
             img_data = base64.b64decode(b64_data)
-            image = QImage.fromData(img_data)
-            pixmap = QPixmap.fromImage(image)
-            scaled_pixmap = pixmap.scaled(
-                self.visual_monitor.size(), 
-                Qt.AspectRatioMode.KeepAspectRatio, 
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.visual_monitor.setPixmap(scaled_pixmap)
+            # Decode straight to monitor size: JPEG scales inside the decoder and other
+            # formats are smooth-scaled once, instead of decoding a full 1080p frame first
+            buffer = QBuffer()
+            buffer.setData(QByteArray(img_data))
+            reader = QImageReader(buffer)
+            target = reader.size()
+            if target.isValid() and not self.visual_monitor.size().isEmpty():
+                target.scale(self.visual_monitor.size(), Qt.AspectRatioMode.KeepAspectRatio)
+                reader.setScaledSize(target)
+            image = reader.read()
+            if image.isNull():
+                raise ValueError(reader.errorString())
+            self.visual_monitor.setPixmap(QPixmap.fromImage(image))
             
             # Context-Aware Status Feedback (Only if buttons aren't showing)
             if self.interaction_stack.currentIndex() == 0:
@@ -1,61 +1,135 @@
 import asyncio
 import logging
-import queue
+import threading
 import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 import speech_recognition as sr
 from PyQt6.QtCore import QThread, pyqtSignal
 from langgraph.checkpoint.memory import MemorySaver
-from core.agent_orchestrator import ArvynOrchestrator
-from config import logger, STRICT_AUTONOMY_MODE, AUTO_APPROVAL
+from config import logger, STRICT_AUTONOMY_MODE, AUTO_APPROVAL, STT_PARTIAL_MAX_CHUNKS
+
+def _local_agreement(previous: str, current: str) -> str:
+    """LocalAgreement-2: the word prefix two consecutive hypotheses agree on."""
+    agreed = []
+    for prev_word, word in zip(previous.split(), current.split()):
+        if prev_word.lower() != word.lower():
+            break
+        agreed.append(word)
+    return " ".join(agreed)
 
 class VoiceWorker(QThread):
     """
     Superior Voice Interaction Layer.
     UPGRADED: Enhanced for Qubrid/Qwen-3 Multi-modal synchronization.
+    PERSISTENT: With persistent=True the thread stays resident between mic presses;
+    begin_listening()/stop_listening() toggle capture without re-spawning the worker
+    or re-initializing the microphone and ambient-noise calibration.
+    STREAMING: Interim hypotheses are emitted on `partial_text` while the user is still
+    speaking; only words confirmed by two consecutive hypotheses are shown.
     """
     text_received = pyqtSignal(str)
+    partial_text = pyqtSignal(str)
     status_signal = pyqtSignal(str)
 
-    def __init__(self):
+    def __init__(self, persistent: bool = False):
         super().__init__()
         self.recognizer = sr.Recognizer()
-        self.mic = sr.Microphone()
-        self._is_active = True
+        self.mic = None  # Opened on the worker thread in run()
+        self._persistent = persistent
+        self._listening = threading.Event()
+        self._shutdown = threading.Event()
+        self._calibrated = False
+        # Interim recognition runs beside capture so listening is never blocked
+        self._partial_pool = ThreadPoolExecutor(max_workers=1)
+        # Interim state is written by the pool thread and reset/read by the capture thread
+        self._partial_lock = threading.Lock()
+        self._utterance = 0  # Bumped per capture so a late interim pass can't leak into the next one
+        self._prev_hypothesis = ""
+        self._committed = ""
+        self._last_partial = None
+        if not persistent:
+            self._listening.set()
         
         self.recognizer.energy_threshold = 300 
         self.recognizer.dynamic_energy_threshold = True
 
+    def begin_listening(self):
+        self._listening.set()
+
+    def stop_listening(self):
+        self._listening.clear()
+
     def stop(self):
-        self._is_active = False
+        self.stop_listening()
+
+    def shutdown(self):
+        """Ends a persistent worker's idle loop."""
+        self._shutdown.set()
+        self._listening.clear()
+        self._partial_pool.shutdown(wait=False, cancel_futures=True)
 
     def run(self):
+        if self.mic is None:
+            self.mic = sr.Microphone()
+        if not self._persistent:
+            self._capture_and_transcribe()
+            self._partial_pool.shutdown(wait=False)
+            return
+        while not self._shutdown.is_set():
+            if self._listening.wait(timeout=0.5) and not self._shutdown.is_set():
+                self._capture_and_transcribe()
+
+    def _capture_and_transcribe(self):
         self.status_signal.emit("LISTENING")
         logger.info("🎙️ VoiceWorker: Microphone active.")
         
         try:
             with self.mic as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.8)
+                if not self._calibrated:
+                    # Dynamic thresholding keeps adapting afterwards; calibrate once
+                    self.recognizer.adjust_for_ambient_noise(source, duration=0.8)
+                    self._calibrated = True
                 audio_chunks = []
+                pending = None
+                with self._partial_lock:
+                    self._utterance += 1
+                    self._prev_hypothesis = ""
+                    self._committed = ""
+                    self._last_partial = None
                 
-                while self._is_active:
+                while self._listening.is_set():
                     try:
                         chunk = self.recognizer.listen(source, timeout=1, phrase_time_limit=4)
                         audio_chunks.append(chunk)
                     except sr.WaitTimeoutError:
                         continue
+                    # Re-hypothesize over the audio so far, unless a pass is still in flight.
+                    # Each pass re-uploads everything captured, so long utterances stop at a cap.
+                    if len(audio_chunks) <= STT_PARTIAL_MAX_CHUNKS and (pending is None or pending.done()):
+                        pending = self._submit_partial(audio_chunks)
                 
                 if not audio_chunks:
                     self.text_received.emit("")
                     return
 
-                combined_audio = sr.AudioData(
-                    b"".join([c.get_raw_data() for c in audio_chunks]),
-                    audio_chunks[0].sample_rate,
-                    audio_chunks[0].sample_width
-                )
+            if self._shutdown.is_set():
+                # Nobody is left to act on it: skip the network pass so the thread exits promptly
+                logger.info("VoiceWorker: Shutdown during capture; utterance discarded.")
+                return
 
             self.status_signal.emit("ANALYZING VOICE")
-            text = self.recognizer.recognize_google(combined_audio)
+            if pending is not None:
+                try:
+                    pending.result()
+                except CancelledError:
+                    pass  # Interim pass cancelled by shutdown(); the full pass below covers it
+            with self._partial_lock:
+                last_partial = self._last_partial
+            if last_partial and last_partial[0] == len(audio_chunks):
+                # The latest interim pass already covered the whole utterance
+                text = last_partial[1]
+            else:
+                text = self.recognizer.recognize_google(self._combine(audio_chunks))
             
             if text:
                 logger.info(f"🗣️ Transcribed: {text}")
@@ -71,6 +145,40 @@ class VoiceWorker(QThread):
             logger.error(f"VoiceWorker Critical Error: {e}")
             self.text_received.emit("")
 
+    def _submit_partial(self, audio_chunks):
+        """Queues an interim pass; None once shutdown() has closed the pool."""
+        try:
+            return self._partial_pool.submit(
+                self._recognize_partial, self._combine(audio_chunks), len(audio_chunks), self._utterance
+            )
+        except RuntimeError:
+            return None
+
+    @staticmethod
+    def _combine(audio_chunks) -> sr.AudioData:
+        return sr.AudioData(
+            b"".join([c.get_raw_data() for c in audio_chunks]),
+            audio_chunks[0].sample_rate,
+            audio_chunks[0].sample_width
+        )
+
+    def _recognize_partial(self, audio: sr.AudioData, chunk_count: int, utterance: int):
+        """Interim pass: emits only the prefix confirmed by the previous hypothesis."""
+        try:
+            hypothesis = self.recognizer.recognize_google(audio)
+        except (sr.UnknownValueError, sr.RequestError):
+            return
+        with self._partial_lock:
+            if utterance != self._utterance:
+                return
+            agreed = _local_agreement(self._prev_hypothesis, hypothesis)
+            self._prev_hypothesis = hypothesis
+            self._last_partial = (chunk_count, hypothesis)
+            if len(agreed) <= len(self._committed):
+                return
+            self._committed = agreed
+        self.partial_text.emit(agreed)
+
 class AgentWorker(QThread):
     """
     Superior Session Orchestration Worker.
@@ -85,6 +193,7 @@ class AgentWorker(QThread):
     auto_mic_signal = pyqtSignal(bool)
     finished_signal = pyqtSignal(dict)
     session_signal = pyqtSignal(str, str)
+    shutdown_complete = pyqtSignal()
 
     _shared_checkpointer = MemorySaver()
 
@@ -111,19 +220,42 @@ class AgentWorker(QThread):
 
     def __init__(self):
         super().__init__()
-        self.command_queue = queue.Queue()
+        # One event loop for the worker's lifetime. It keeps running between commands,
+        # so approvals and timeouts scheduled while idle are never dropped.
+        self.loop = asyncio.new_event_loop()
+        self._commands = None  # asyncio.Queue, created lazily on the worker loop
+        self._pending = 0
+        self._pending_lock = threading.Lock()
         self.orchestrator = None
-        self.loop = None
-        self._is_running = True
+        # Cooperative cancellation token polled between graph steps
+        self._cancel = threading.Event()
         self.session_config = {"configurable": {"thread_id": "arvyn_autonomous_v4_qubrid"}, "recursion_limit": 100}
         self.approval_timeout_task = None
 
     def submit_command(self, user_command: str):
-        self.command_queue.put(user_command)
+        """Thread-safe entrypoint: posts the command onto the worker's event loop."""
+        with self._pending_lock:
+            self._pending += 1
+        try:
+            self.loop.call_soon_threadsafe(self._enqueue, user_command)
+        except RuntimeError:
+            # Loop already closed by shutdown
+            with self._pending_lock:
+                self._pending -= 1
+
+    def _enqueue(self, item):
+        if self._commands is None:
+            self._commands = asyncio.Queue()
+        self._commands.put_nowait(item)
+
+    @property
+    def is_busy(self) -> bool:
+        """True while a submitted command is queued or still executing."""
+        return self._pending > 0
 
     def submit_session_info(self, session_name: str, info_text: str):
         """Thread-safe entrypoint: forward session info to the orchestrator's SessionManager."""
-        if not self.loop or not self.orchestrator:
+        if not self.orchestrator:
             # Queue a lightweight command fallback if orchestrator not ready
             self.submit_command(f"SESSION_INFO::{session_name}::{info_text}")
             return
@@ -145,22 +277,23 @@ class AgentWorker(QThread):
             logger.error(f"_submit_session_info_async error: {e}")
 
     def stop_persistent_session(self):
-        self._is_running = False
+        self._cancel.set()
         # Do not schedule cleanup here; the run() loop will handle it upon exit
-        self.command_queue.put(None)
+        try:
+            self.loop.call_soon_threadsafe(self._enqueue, None)
+        except RuntimeError:
+            pass
 
     def run(self):
-        self.loop = asyncio.new_event_loop()
+        # Imported here so the Playwright/LangGraph stack loads on the worker thread,
+        # overlapping with the orb's first paint instead of delaying it.
+        from core.agent_orchestrator import ArvynOrchestrator
+
         asyncio.set_event_loop(self.loop)
         self.orchestrator = ArvynOrchestrator()
-        self.loop.run_until_complete(self.orchestrator.init_app(self._shared_checkpointer))
-        
+
         try:
-            while self._is_running:
-                command = self.command_queue.get()
-                if command is None: break 
-                self.loop.run_until_complete(self.execute_task(command))
-                self.command_queue.task_done()
+            self.loop.run_until_complete(self._agent_loop())
         except Exception as e:
             logger.error(f"AgentWorker Main Loop Error: {e}")
         finally:
@@ -170,12 +303,35 @@ class AgentWorker(QThread):
                 except Exception as e:
                     logger.error(f"Cleanup during shutdown failed: {e}")
             self._shutdown_loop()
+            # Commands still queued (or dequeued after a cancel) never reach the drain loop's
+            # decrement; clear the count so is_busy can't stay stuck on a dead worker
+            with self._pending_lock:
+                self._pending = 0
+            # Emitted only after the browser and loop are fully released
+            self.shutdown_complete.emit()
+
+    async def _agent_loop(self):
+        """Drains the command queue on the persistent loop until cancelled."""
+        await self.orchestrator.init_app(self._shared_checkpointer)
+        if self._commands is None:
+            self._commands = asyncio.Queue()
+        while not self._cancel.is_set():
+            command = await self._commands.get()
+            if command is None or self._cancel.is_set(): break
+            try:
+                await self.execute_task(command)
+            finally:
+                with self._pending_lock:
+                    self._pending -= 1
 
     def _shutdown_loop(self):
         try:
             pending = asyncio.all_tasks(self.loop)
             if pending:
-                self.loop.run_until_complete(asyncio.gather(*pending))
+                # Cancel rather than await leftovers (e.g. the 60s approval timeout)
+                for task in pending:
+                    task.cancel()
+                self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
             self.loop.close()
             logger.info("✅ AgentWorker: Qubrid Engine session closed safely.")
         except Exception as e:
@@ -201,7 +357,7 @@ class AgentWorker(QThread):
                 )
                 
                 async for event in self.orchestrator.app.astream(None, config=self.session_config):
-                    if not self._is_running: return
+                    if self._cancel.is_set(): return
                     try:
                         for node_name, output in event.items():
                             self._sync_orchestrator_logs()
@@ -231,7 +387,7 @@ class AgentWorker(QThread):
                 }
 
                 async for event in self.orchestrator.app.astream(initial_input, config=self.session_config):
-                    if not self._is_running: return
+                    if self._cancel.is_set(): return
                     try:
                         for node_name, output in event.items():
                             self._sync_orchestrator_logs()
@@ -326,13 +482,15 @@ class AgentWorker(QThread):
                 self.speak_signal.emit(output["pending_question"])
 
     def resume_with_approval(self, approved: bool):
+        if self.loop.is_closed():
+            return
         # Cancel any pending timeout
         if self.approval_timeout_task:
-            self.approval_timeout_task.cancel()
+            # Task.cancel is not thread-safe; hand it to the owning loop
+            self.loop.call_soon_threadsafe(self.approval_timeout_task.cancel)
             self.approval_timeout_task = None
-            
-        if self.loop and self.loop.is_running():
-            asyncio.run_coroutine_threadsafe(self._resume_logic(approved), self.loop)
+
+        asyncio.run_coroutine_threadsafe(self._resume_logic(approved), self.loop)
 
     async def _resume_logic(self, approved: bool):
         decision = "approved" if approved else "rejected"
@@ -343,7 +501,7 @@ class AgentWorker(QThread):
         self.log_signal.emit(f"🛡️ USER INTERVENTION: {decision.upper()}")
         self.approval_signal.emit(False, False)
         async for event in self.orchestrator.app.astream(None, config=self.session_config):
-            if not self._is_running: return
+            if self._cancel.is_set(): return
             for node_name, output in event.items():
                 self._sync_orchestrator_logs()
                 self._handle_node_output(node_name, output)
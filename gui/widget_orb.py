@@ -19,6 +19,8 @@ class ArvynOrb(QWidget):
             Qt.WindowType.Tool
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        # Orb paints its own background; skip the system fill before the first show()
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         
         # Initial size from config
         self.resize(ORB_SIZE, ORB_SIZE)
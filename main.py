@@ -1,8 +1,15 @@
 import sys
 import os
 import asyncio
-import logging
+import re
 import traceback
+from collections import deque
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+# Qt reads scaling env vars during static init, so they must be set before PyQt6 loads.
+# Qt6 always scales for HiDPI; QT_ENABLE_HIGHDPI_SCALING is its name for the old opt-in.
+os.environ.setdefault("QT_ENABLE_HIGHDPI_SCALING", "1")
 from PyQt6.QtWidgets import QApplication, QStackedWidget
 from PyQt6.QtCore import Qt, QPropertyAnimation, QRect, QEasingCurve, QTimer
 
@@ -14,7 +21,10 @@ from config import (
     DASHBOARD_SIZE, 
     STRICT_AUTONOMY_MODE, 
     AUTO_APPROVAL,
-    QUBRID_MODEL_NAME
+    QUBRID_MODEL_NAME,
+    SHUTDOWN_WATCHDOG_MS,
+    PROJECT_URL,
+    PRIORITY_KEYWORDS
 )
 
 from gui.widget_orb import ArvynOrb
@@ -22,11 +32,31 @@ from gui.dashboard import ArvynDashboard
 from gui.threads import AgentWorker, VoiceWorker
 from tools.voice import ArvynVoice
 
+# Single background thread that formats and logs fatal tracebacks off the UI thread
+_crash_log_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ArvynCrashLog")
+
+def _log_fatal(exctype, value, tb):
+    # Formatted once: the same text goes to the log and, as sys.__excepthook__ would print it, to stderr
+    err_msg = "".join(traceback.TracebackException(exctype, value, tb).format())
+    logger.critical("FATAL UI EXCEPTION:\n%s", err_msg)
+    sys.stderr.write(err_msg)
+    sys.stderr.flush()
+
 def exception_hook(exctype, value, tb):
     """Global handler for FATAL UI errors."""
-    err_msg = "".join(traceback.format_exception(exctype, value, tb))
-    logger.critical(f"FATAL UI EXCEPTION:\n{err_msg}")
-    sys.__excepthook__(exctype, value, tb)
+    if issubclass(exctype, (KeyboardInterrupt, SystemExit)):
+        # Deliberate exits: nothing to diagnose, skip formatting entirely
+        sys.__excepthook__(exctype, value, tb)
+        return
+    if issubclass(exctype, asyncio.CancelledError):
+        # Cancellation during shutdown is routine; the type name is enough
+        logger.warning("Unhandled cancellation reached the UI thread: %s", exctype.__name__)
+        return
+    try:
+        _crash_log_executor.submit(_log_fatal, exctype, value, tb)
+    except RuntimeError:
+        # Executor already shut down during interpreter exit: log inline
+        _log_fatal(exctype, value, tb)
 
 sys.excepthook = exception_hook
 
@@ -38,19 +68,43 @@ class ArvynApp(ArvynOrb):
     IMPROVED: Enhanced status reporting for multi-layer kinetic interactions.
     PRESERVED: Full Qubrid/Qwen-3 Logic, VoiceWorker, and HITL approval flows.
     """
+    __slots__ = (
+        'voice', '_is_expanded', 'container',
+        'dashboard', 'worker', 'voice_worker', '_geo_anim', '_last_submitted',
+        '_log_queue', '_log_timer', '_latest_shot', '_shot_timer', '_pending_status', '_status_timer',
+        '_screen_geom', '_watched_screen', '_expanded_rect', '_shrunk_rect', '_last_status', '_auto_mic_armed',
+        '_live_threads'
+    )
+
+    # (display label, dashboard header) pairs, keyed by the raw status the workers emit.
+    # Bounded because orchestrator step names flow through here too.
+    _STATUS_CACHE = {}
+    _STATUS_CACHE_MAX = 256
+    _HEADER_PREFIX = "ARVYN // "
+
+    # Portal routing knobs live in config so every launcher shares one definition
+    PROJECT_URL = PROJECT_URL
+    PRIORITY_KEYWORDS = PRIORITY_KEYWORDS
+    # Single alternation compiled once at import: one linear C-level scan per command.
+    # Sorted so the pattern is stable across runs despite frozenset ordering.
+    _PRIORITY_RE = re.compile("|".join(map(re.escape, sorted(PRIORITY_KEYWORDS))))
+
     def __init__(self):
         super().__init__()
         
-        # --- PROJECT SPECIFIC PRIORITY MAP ---
-        self.PROJECT_URL = "https://roshan-chaudhary13.github.io/rio_finance_bank/"
-        self.PRIORITY_KEYWORDS = [
-            "bill", "electricity", "gold", "profile", "login", 
-            "bank", "rio", "loan", "account", "transfer", "pay",
-            "balance", "statement", "credit", "debit"
-        ]
-
         logger.info("[SYSTEM] Initializing Arvyn Integrity Check (v5.0)...")
         self.voice = ArvynVoice()
+
+        # Screen geometry is cached and refreshed only when the screen setup changes
+        self._watched_screen = None
+        self._watch_primary_screen(QApplication.primaryScreen())
+        QApplication.instance().primaryScreenChanged.connect(self._watch_primary_screen)
+        QApplication.instance().screenAdded.connect(self._refresh_screen_geom)
+        QApplication.instance().screenRemoved.connect(self._refresh_screen_geom)
+
+        # One Orb <-> Dashboard morph animation, re-seeded per transition
+        self._geo_anim = QPropertyAnimation(self, b"geometry")
+        self._geo_anim.finished.connect(self._on_geo_anim_finished)
         self._is_expanded = False
         self.container = QStackedWidget()
         
@@ -60,12 +114,46 @@ class ArvynApp(ArvynOrb):
         self.container.addWidget(self.dashboard)
         self.layout.addWidget(self.container)
 
+        # Worker log lines are buffered and flushed to the dashboard in batches
+        self._log_queue = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(33)
+        self._log_timer.timeout.connect(self._flush_logs)
+
+        # Only the newest worker screenshot is kept; stale frames are dropped unpainted
+        self._latest_shot = None
+        self._shot_timer = QTimer(self)
+        self._shot_timer.setSingleShot(True)
+        self._shot_timer.setInterval(16)
+        self._shot_timer.timeout.connect(self._flush_screenshot)
+
+        # Worker status updates are latest-wins: one repaint per frame at most
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_status)
+
+        # Set by auto_mic_signal, consumed when the voice reports speech_finished
+        self._auto_mic_armed = False
+
         # Worker initialization
         self.worker = AgentWorker() 
         self._connect_worker_signals()
-        self.worker.start()
+        # Start on the first event-loop tick so the orb paints before the thread spawns.
+        # Commands submitted earlier simply wait in the worker's queue.
+        QTimer.singleShot(0, self.worker.start)
 
-        self.voice_worker = None
+        # Resident voice worker: toggled per mic press instead of re-spawned
+        self.voice_worker = VoiceWorker(persistent=True)
+        self.voice_worker.text_received.connect(self._handle_voice_success)
+        self.voice_worker.partial_text.connect(self.dashboard.input_field.setText)
+        self.voice_worker.status_signal.connect(self._enqueue_status)
+        QTimer.singleShot(0, self.voice_worker.start)
+        self._last_submitted = None
+        self._last_status = None
+        self._live_threads = None  # Worker threads still unwinding once shutdown begins
         
         # UI Signal Connections
         self.clicked.connect(self.initiate_expansion)
@@ -78,16 +166,15 @@ class ArvynApp(ArvynOrb):
         self.dashboard.minimize_requested.connect(self.initiate_shrink)
         self.dashboard.stop_requested.connect(self.kill_agent)
 
-        # Frameless Top-Hint Window settings
-        self.setWindowFlags(self.windowFlags() | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.FramelessWindowHint)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        # Window flags and background attributes are applied once in ArvynOrb.__init__;
+        # re-applying them here would force a native window re-creation.
         
         self.move_to_default_position()
         self.start_pulse()
         
         # v5.0 Initialization Reporting
         mode_label = "AUTONOMOUS" if STRICT_AUTONOMY_MODE else "HITL-STANDARD"
-        logger.info(f"🛡️ Arvyn App v5.0: {mode_label} Controller ({QUBRID_MODEL_NAME}) active.")
+        logger.info("🛡️ Arvyn App v5.0: %s Controller (%s) active.", mode_label, QUBRID_MODEL_NAME)
         
         self.dashboard.append_log(f"SYSTEM: Environment Verified. Engine: {QUBRID_MODEL_NAME}", category="system")
         self.dashboard.append_log(f"SYSTEM: Semantic Kinetic Engine: v5.0 Focus-Lock Active.", category="system")
@@ -95,21 +182,93 @@ class ArvynApp(ArvynOrb):
 
     def _connect_worker_signals(self):
         """Maps backend worker signals to Dashboard UI updates."""
-        self.worker.log_signal.connect(self.dashboard.append_log)
-        self.worker.status_signal.connect(self._update_ui_status)
-        self.worker.screenshot_signal.connect(self.dashboard.update_screenshot)
+        self.worker.log_signal.connect(self._enqueue_log)
+        self.worker.status_signal.connect(self._enqueue_status)
+        self.worker.screenshot_signal.connect(self._enqueue_screenshot)
         self.worker.approval_signal.connect(self._toggle_approval_ui)
         self.worker.speak_signal.connect(self.voice.speak)
+        self.voice.speech_finished.connect(self._arm_mic_if_ready)
         self.worker.auto_mic_signal.connect(self._handle_auto_mic_logic)
 
+    def _enqueue_log(self, msg: str, category: str = "general"):
+        """Buffers a worker log line; the flush timer renders the batch (~30 Hz)."""
+        self._log_queue.append((msg, category))
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_logs(self):
+        """Renders every buffered log line with a single dashboard append."""
+        batch, self._log_queue = self._log_queue, deque()
+        self.dashboard.append_logs(batch)
+
+    def _enqueue_screenshot(self, b64_data: str):
+        """Keeps only the latest frame; intermediate frames are never decoded."""
+        self._latest_shot = b64_data
+        if not self._shot_timer.isActive():
+            self._shot_timer.start()
+
+    def _flush_screenshot(self):
+        """Paints the most recent pending frame (at most once per ~16 ms)."""
+        shot, self._latest_shot = self._latest_shot, None
+        if shot is not None:
+            self.dashboard.update_screenshot(shot)
+
+    def _enqueue_status(self, status: str):
+        """Coalesces worker status bursts; only the newest value is rendered."""
+        self._pending_status = status
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        status, self._pending_status = self._pending_status, None
+        if status is not None:
+            self._apply_status(status)
+
     def _handle_auto_mic_logic(self, should_start: bool):
-        """Triggers the microphone automatically after TTS sequences."""
-        if should_start and not self.dashboard.is_listening:
-            QTimer.singleShot(2200, self.dashboard._toggle_mic)
+        """Arms the microphone to open as soon as the current TTS utterance finishes."""
+        self._auto_mic_armed = should_start and not self.dashboard.is_listening
+        if self._auto_mic_armed and not self.voice.is_available:
+            # No TTS backend to signal completion: open the mic after a short beat.
+            QTimer.singleShot(200, self._arm_mic_if_ready)
+
+    def _arm_mic_if_ready(self):
+        """SPEAKING -> LISTENING transition; never toggles an already-open mic closed."""
+        if not self._auto_mic_armed:
+            return
+        self._auto_mic_armed = False
+        if not self.dashboard.is_listening:
+            self.dashboard._toggle_mic()
+
+    def _watch_primary_screen(self, screen):
+        """Tracks available-geometry changes (resolution, taskbar/dock) of the primary screen."""
+        if self._watched_screen is not None:
+            try:
+                self._watched_screen.availableGeometryChanged.disconnect(self._refresh_screen_geom)
+            except (TypeError, RuntimeError):
+                pass  # Previous screen already gone
+        self._watched_screen = screen
+        screen.availableGeometryChanged.connect(self._refresh_screen_geom)
+        self._refresh_screen_geom()
+
+    def _refresh_screen_geom(self, *_):
+        """Re-reads the primary screen's available geometry and the morph targets."""
+        screen = self._screen_geom = QApplication.primaryScreen().availableGeometry()
+        self._expanded_rect = QRect(
+            screen.width() - DASHBOARD_SIZE[0] - 40,
+            screen.height() - DASHBOARD_SIZE[1] - 40,
+            DASHBOARD_SIZE[0],
+            DASHBOARD_SIZE[1]
+        )
+        self._shrunk_rect = QRect(
+            screen.width() - ORB_SIZE - 40,
+            screen.height() - ORB_SIZE - 40,
+            ORB_SIZE,
+            ORB_SIZE
+        )
 
     def move_to_default_position(self):
         """Positions the Orb at the bottom-right of the screen."""
-        screen = QApplication.primaryScreen().availableGeometry()
+        screen = self._screen_geom
         x = screen.width() - self.width() - 40
         y = screen.height() - self.height() - 40
         self.move(x, y)
@@ -119,104 +278,151 @@ class ArvynApp(ArvynOrb):
         if not self._is_expanded:
             self._is_expanded = True
             self.stop_pulse()
-            self.anim = QPropertyAnimation(self, b"geometry")
-            self.anim.setDuration(450)
-            self.anim.setStartValue(self.geometry())
-            screen = QApplication.primaryScreen().availableGeometry()
-            new_rect = QRect(
-                screen.width() - DASHBOARD_SIZE[0] - 40,
-                screen.height() - DASHBOARD_SIZE[1] - 40,
-                DASHBOARD_SIZE[0],
-                DASHBOARD_SIZE[1]
-            )
-            self.anim.setEndValue(new_rect)
-            self.anim.setEasingCurve(QEasingCurve.Type.OutCubic)
-            self.anim.finished.connect(self._switch_to_dashboard_view)
-            self.anim.start()
+            self._run_geo_anim(self._expanded_rect, 450, QEasingCurve.Type.OutCubic)
 
     def initiate_shrink(self):
         """Animates the transition from Dashboard back to Orb."""
         if self._is_expanded:
             self._is_expanded = False
-            self.container.setCurrentIndex(0)
-            self.anim = QPropertyAnimation(self, b"geometry")
-            self.anim.setDuration(400)
-            self.anim.setStartValue(self.geometry())
-            screen = QApplication.primaryScreen().availableGeometry()
-            new_rect = QRect(
-                screen.width() - ORB_SIZE - 40,
-                screen.height() - ORB_SIZE - 40,
-                ORB_SIZE,
-                ORB_SIZE
-            )
-            self.anim.setEndValue(new_rect)
-            self.anim.setEasingCurve(QEasingCurve.Type.InCubic)
-            self.anim.finished.connect(self.start_pulse)
-            self.anim.start()
+            self._set_container_index(0)
+            self._run_geo_anim(self._shrunk_rect, 400, QEasingCurve.Type.InCubic)
+
+    def _run_geo_anim(self, end_rect: QRect, duration: int, easing: QEasingCurve.Type):
+        # stop() does not emit finished, so an interrupted morph never fires the old target's slot
+        self._geo_anim.stop()
+        self._geo_anim.setDuration(duration)
+        self._geo_anim.setEasingCurve(easing)
+        self._geo_anim.setStartValue(self.geometry())
+        self._geo_anim.setEndValue(end_rect)
+        self._geo_anim.start()
+
+    def _on_geo_anim_finished(self):
+        if self._is_expanded:
+            self._switch_to_dashboard_view()
+        else:
+            self.start_pulse()
 
     def _switch_to_dashboard_view(self):
-        self.container.setCurrentIndex(1)
+        self._set_container_index(1)
         self.dashboard.input_field.setFocus()
 
     def process_command(self, command_text: str):
         """Validates and applies priority routing for v5.0 tasks."""
         clean_text = command_text.strip().lower()
-        if clean_text:
-            self.dashboard.append_log(f"USER: {clean_text.upper()}", category="system")
-            self.dashboard.input_field.clear()
+        if not clean_text:
+            return
+
+        # Ignore an immediate repeat while the worker is still busy with it
+        if clean_text == self._last_submitted and self.worker.is_busy:
+            logger.info("Arvyn Main: Dropped duplicate command while the worker is busy: %s", clean_text)
+            self.dashboard.append_log("Duplicate command ignored.", category="system")
+            return
+        self._last_submitted = clean_text
 
-            is_priority_task = any(key in clean_text for key in self.PRIORITY_KEYWORDS)
+        self.dashboard.append_log(f"USER: {clean_text.upper()}", category="system")
+        self.dashboard.input_field.clear()
 
-            if is_priority_task:
-                self.dashboard.append_log(f"🎯 TARGET LOCKED: Rio Finance Bank", category="kinetic")
-                self.dashboard.append_log(f"NETWORK: Semantic Sync active for portal interaction.", category="system")
-                self.worker.submit_command(f"Open {self.PROJECT_URL} and {clean_text}")
-            else:
-                self.worker.submit_command(clean_text)
+        # One precompiled scan; substring matching also catches inflected forms such as "payment"
+        is_priority_task = bool(self.PRIORITY_KEYWORDS) and self._PRIORITY_RE.search(clean_text) is not None
+
+        if is_priority_task:
+            self.dashboard.append_log(f"🎯 TARGET LOCKED: Rio Finance Bank", category="kinetic")
+            self.dashboard.append_log(f"NETWORK: Semantic Sync active for portal interaction.", category="system")
+            self.worker.submit_command(f"Open {self.PROJECT_URL} and {clean_text}")
+        else:
+            self.worker.submit_command(clean_text)
 
     def trigger_voice_input(self, should_start: bool):
-        """Starts or stops the Voice Transcriber worker."""
+        """Starts or stops capture on the resident Voice Transcriber worker."""
         if should_start:
-            if self.voice_worker and self.voice_worker.isRunning():
-                return
-            self.voice_worker = VoiceWorker()
-            self.voice_worker.text_received.connect(self._handle_voice_success)
-            self.voice_worker.status_signal.connect(self._update_ui_status)
-            self.voice_worker.start()
+            self.voice_worker.begin_listening()
         else:
-            if self.voice_worker and self.voice_worker.isRunning():
-                self.voice_worker.stop()
+            self.voice_worker.stop_listening()
 
     def _handle_voice_success(self, text):
         if text:
-            logger.info(f"🗣️ Transcribed: {text}")
+            logger.info("🗣️ Transcribed: %s", text)
             self.process_command(text)
         else:
             self._update_ui_status("Ready")
 
     def kill_agent(self):
         """Emergency release of all system resources."""
+        if self._live_threads is not None:
+            return  # Shutdown already in progress
         logger.warning("🛑 Arvyn Main: Emergency shutdown initiated.")
-        if self.worker and self.worker.isRunning():
+        # Quit only once every worker thread has exited: Qt aborts on destroying a running QThread,
+        # and the resident VoiceWorker holds the microphone stream until it unwinds
+        self._live_threads = {t for t in (self.worker, self.voice_worker) if t is not None and t.isRunning()}
+        for thread in self._live_threads:
+            thread.finished.connect(partial(self._on_thread_finished, thread), Qt.ConnectionType.SingleShotConnection)
+        self.voice_worker.shutdown()
+        if self.worker in self._live_threads:
             self.worker.stop_persistent_session()
             self._update_ui_status("STOPPED")
             self.dashboard.append_log("System: Deactivating Semantic Layer...", category="error")
             self.dashboard.append_log("System: Resources released.", category="error")
-        QTimer.singleShot(1000, QApplication.instance().quit)
+        if self._live_threads:
+            # Watchdog in case teardown hangs
+            QTimer.singleShot(SHUTDOWN_WATCHDOG_MS, self._shutdown_watchdog)
+        else:
+            QApplication.instance().quit()
+
+    def _on_thread_finished(self, thread):
+        # finished fires as run() returns; the join just lets the thread object settle
+        thread.wait()
+        self._live_threads.discard(thread)
+        if not self._live_threads:
+            QApplication.instance().quit()
+
+    def _shutdown_watchdog(self):
+        """Reports a hung teardown; never quits over a thread that is still running."""
+        running = [t for t in self._live_threads if t.isRunning()]
+        if running:
+            logger.warning("Shutdown still waiting on: %s", ", ".join(type(t).__name__ for t in running))
+            QTimer.singleShot(SHUTDOWN_WATCHDOG_MS, self._shutdown_watchdog)
+        else:
+            QApplication.instance().quit()
 
     def _update_ui_status(self, status: str):
         """Updates status labels on both Orb and Dashboard."""
-        display_status = status.replace("_", " ").upper()
-        self.dashboard.header.setText(f"ARVYN // {display_status}")
+        # A direct update supersedes any worker status still waiting for the next frame
+        self._pending_status = None
+        self._apply_status(status)
+
+    def _apply_status(self, status: str):
+        # Chatty workers repeat the same status; drop those before any string work
+        if status == self._last_status:
+            return
+        self._last_status = status
+        labels = self._STATUS_CACHE.get(status)
+        if labels is None:
+            if len(self._STATUS_CACHE) >= self._STATUS_CACHE_MAX:
+                self._STATUS_CACHE.clear()
+            display_status = status.replace("_", " ").upper()
+            labels = self._STATUS_CACHE[status] = (display_status, self._HEADER_PREFIX + display_status)
+        display_status, header = labels
+        self.dashboard.header.setText(header)
         self.status_label.setText(display_status)
 
+    def _set_container_index(self, index: int):
+        """Switches the Orb/Dashboard stack only when the page actually changes."""
+        if self.container.currentIndex() != index:
+            self.container.setCurrentIndex(index)
+
+    def _set_interaction_index(self, index: int):
+        """Switches the input/approval stack only when the page actually changes."""
+        stack = self.dashboard.interaction_stack
+        if stack.currentIndex() != index:
+            stack.setCurrentIndex(index)
+
     def _toggle_approval_ui(self, show: bool, force_manual: bool = False):
         """Handles manual approval requests or auto-approval bypass."""
-        logger.info(f"🛡️ UI Approval Toggle: show={show}, force_manual={force_manual}")
+        logger.info("🛡️ UI Approval Toggle: show=%s, force_manual=%s", show, force_manual)
         # CONCISE PAUSE FEATURE: Override auto-approval for security fields
         if show and force_manual:
              self.dashboard.append_log("🛡️ SECURITY LOCK: Manual approval required for PIN/Payment.", category="kinetic")
-             self.dashboard.interaction_stack.setCurrentIndex(1)
+             self._set_interaction_index(1)
              self.activateWindow()
              return
 
@@ -224,7 +430,7 @@ class ArvynApp(ArvynOrb):
             self.handle_hitl_approval(True)
             return
 
-        self.dashboard.interaction_stack.setCurrentIndex(1 if show else 0)
+        self._set_interaction_index(1 if show else 0)
         if show:
             self.activateWindow()
             self.dashboard.append_log("NOTIFICATION: Semantic Sync requires manual verification.", category="kinetic")
@@ -243,12 +449,11 @@ class ArvynApp(ArvynOrb):
 
 
 if __name__ == "__main__":
-    os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
     app = QApplication(sys.argv)
     try:
         arvyn = ArvynApp()
         arvyn.show()
         sys.exit(app.exec())
     except Exception as e:
-        logger.critical(f"Arvyn Core Fatal Error: {e}")
+        logger.critical("Arvyn Core Fatal Error: %s", e)
         sys.exit(1)
\ No newline at end of file
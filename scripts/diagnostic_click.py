@@ -17,6 +17,7 @@ logger = logging.getLogger("diagnostic")
 RIO_URL = "https://roshan-chaudhary13.github.io/rio_finance_bank/"
 
 async def run():
+    os.makedirs(SCREENSHOT_PATH, exist_ok=True)
     browser = ArvynBrowser(headless=False)
     try:
         await browser.start()
@@ -29,17 +30,16 @@ async def run():
 
         logger.info("Attempting semantic click with hint 'Login'...")
         success = await browser.click_at_coordinates(viewport_center_x, viewport_center_y, element_hint="Login")
-        logger.info(f"Click result: {success}")
+        logger.info("Click result: %s", success)
 
         # Save a final screenshot
-        if not os.path.exists(SCREENSHOT_PATH): os.makedirs(SCREENSHOT_PATH)
         path = os.path.join(SCREENSHOT_PATH, f"diagnostic_result_{int(time.time())}.png")
         page = await browser.ensure_page()
         await page.screenshot(path=path)
-        logger.info(f"Saved result screenshot: {path}")
+        logger.info("Saved result screenshot: %s", path)
 
     except Exception as e:
-        logger.error(f"Diagnostic run failed: {e}")
+        logger.error("Diagnostic run failed: %s", e)
     finally:
         try:
             await browser.close()
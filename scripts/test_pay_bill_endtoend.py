@@ -12,13 +12,15 @@ from core.agent_orchestrator import ArvynOrchestrator
 
 async def run_test():
     orch = ArvynOrchestrator()
-    # Ensure browser starts
-    await orch.browser.start()
-
-    # Provide test credentials in profile (temporary)
-    orch.profile.update_provider('Rio Finance Bank', {
-        'login_credentials': {'email': 'testuser@example.com', 'password': 'P@ssw0rd!'}
-    })
+    # Browser launch and the profile write are independent: overlap them.
+    # The profile write is blocking file I/O, so it runs off the event loop.
+    await asyncio.gather(
+        orch.browser.start(),
+        # Provide test credentials in profile (temporary)
+        asyncio.to_thread(orch.profile.update_provider, 'Rio Finance Bank', {
+            'login_credentials': {'email': 'testuser@example.com', 'password': 'P@ssw0rd!'}
+        })
+    )
 
     state = {
         'messages': [],
@@ -0,0 +1,197 @@
+import json
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from core.qwen_logic import QwenBrain
+from core.state_schema import IntentOutput
+from gui.threads import VoiceWorker, _local_agreement
+from tools.browser import BrowserPool
+
+
+class TestLocalAgreement(unittest.TestCase):
+    """
+    LocalAgreement-2 partial filter used by VoiceWorker's interim transcripts.
+    Run this with: python -m pytest test_components.py
+    """
+
+    def test_common_prefix_is_confirmed(self):
+        self.assertEqual(_local_agreement("pay my electricity", "pay my electricity bill"), "pay my electricity")
+
+    def test_stops_at_first_disagreement(self):
+        self.assertEqual(_local_agreement("pay my electric city bill", "pay my electricity bill"), "pay my")
+
+    def test_case_insensitive_keeps_latest_casing(self):
+        self.assertEqual(_local_agreement("open rio", "Open Rio finance"), "Open Rio")
+
+    def test_empty_or_unrelated_hypotheses(self):
+        self.assertEqual(_local_agreement("", "buy gold"), "")
+        self.assertEqual(_local_agreement("buy gold", ""), "")
+        self.assertEqual(_local_agreement("login", "buy gold"), "")
+
+
+class TestInterimPasses(unittest.TestCase):
+    """VoiceWorker._recognize_partial with a mocked recognizer (no microphone or network)."""
+
+    def setUp(self):
+        self.worker = VoiceWorker()
+        self.worker._utterance = 1
+        self.emitted = []
+        self.worker.partial_text.connect(self.emitted.append)
+
+    def tearDown(self):
+        self.worker._partial_pool.shutdown(wait=False)
+
+    def _pass(self, hypothesis, chunk_count, utterance=1):
+        self.worker.recognizer.recognize_google = MagicMock(return_value=hypothesis)
+        self.worker._recognize_partial(MagicMock(), chunk_count, utterance)
+
+    def test_only_growing_agreed_prefix_is_emitted(self):
+        self._pass("pay my", 1)
+        self._pass("pay my bill", 2)
+        self._pass("pay my bill", 3)
+        self.assertEqual(self.emitted, ["pay my", "pay my bill"])
+        self.assertEqual(self.worker._last_partial, (3, "pay my bill"))
+
+    def test_stale_utterance_is_ignored(self):
+        self._pass("buy gold", 1)
+        self.worker._utterance = 2
+        self._pass("buy gold now", 2, utterance=1)
+        self.assertEqual(self.worker._last_partial, (1, "buy gold"))
+        self.assertEqual(self.emitted, [])
+
+
+class TestIntentCache(unittest.IsolatedAsyncioTestCase):
+    """Memoized parse_intent: hits skip the model call, the LRU evicts, and callers get copies."""
+
+    def setUp(self):
+        self.brain = QwenBrain(model_name="test-model")
+        self.brain._call_with_retry = AsyncMock(side_effect=self._reply)
+
+    @staticmethod
+    async def _reply(prompt: str):
+        # Echo the command back so each input maps to a distinguishable intent
+        command = prompt.split('USER COMMAND: "', 1)[1].split('"', 1)[0]
+        return json.dumps({
+            "action": "UPDATE_PROFILE",
+            "target": "BANKING",
+            "provider": "Rio Finance Bank",
+            "fields_to_update": {"full_name": command},
+            "urgency": "HIGH",
+            "reasoning": "test"
+        })
+
+    async def test_repeat_command_hits_cache(self):
+        first = await self.brain.parse_intent("change my name to akash")
+        # Whitespace differences normalize to the same key
+        second = await self.brain.parse_intent("  change my   name to akash ")
+        self.assertEqual(self.brain._call_with_retry.await_count, 1)
+        self.assertEqual(first, second)
+
+    async def test_returns_deep_copies(self):
+        first = await self.brain.parse_intent("change my name to akash")
+        first.fields_to_update["full_name"] = "mutated"
+        second = await self.brain.parse_intent("change my name to akash")
+        self.assertEqual(second.fields_to_update["full_name"], "change my name to akash")
+        second.fields_to_update["full_name"] = "mutated again"
+        third = await self.brain.parse_intent("change my name to akash")
+        self.assertIsNot(second, third)
+        self.assertEqual(third.fields_to_update["full_name"], "change my name to akash")
+
+    async def test_least_recently_used_is_evicted(self):
+        with patch("core.qwen_logic.INTENT_CACHE_SIZE", 2):
+            await self.brain.parse_intent("a")
+            await self.brain.parse_intent("b")
+            await self.brain.parse_intent("a")  # Hit: "b" becomes least recently used
+            await self.brain.parse_intent("c")  # Evicts "b"
+            self.assertEqual(len(self.brain._intent_cache), 2)
+            self.assertEqual(self.brain._call_with_retry.await_count, 3)
+            await self.brain.parse_intent("a")
+            self.assertEqual(self.brain._call_with_retry.await_count, 3)
+            await self.brain.parse_intent("b")
+            self.assertEqual(self.brain._call_with_retry.await_count, 4)
+
+    async def test_disabled_cache_and_failures_are_not_stored(self):
+        with patch("core.qwen_logic.INTENT_CACHE_SIZE", 0):
+            await self.brain.parse_intent("a")
+            await self.brain.parse_intent("a")
+        self.assertEqual(self.brain._call_with_retry.await_count, 2)
+        self.assertFalse(self.brain._intent_cache)
+
+        self.brain._call_with_retry = AsyncMock(side_effect=RuntimeError("offline"))
+        fallback = await self.brain.parse_intent("b")
+        self.assertIsInstance(fallback, IntentOutput)
+        self.assertEqual(fallback.action, "NAVIGATE")
+        self.assertFalse(self.brain._intent_cache)
+
+
+class TestBrowserPoolLeases(unittest.IsolatedAsyncioTestCase):
+    """Ref-counted BrowserPool leases with a mocked Chromium launch (no browser is started)."""
+
+    async def asyncSetUp(self):
+        self.pool = BrowserPool(headless=True)
+        self.pool._launch = AsyncMock(side_effect=self._fake_browser)
+        self.launched = []
+        for name, value in (("POOL_MIN_SIZE", 0), ("POOL_MAX_SIZE", 2), ("POOL_IDLE_TIMEOUT", 3600)):
+            patcher = patch(f"tools.browser.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.pool.shutdown()
+
+    def _fake_browser(self):
+        browser = MagicMock()
+        browser.is_connected.return_value = True
+        browser.close = AsyncMock()
+        self.launched.append(browser)
+        return browser
+
+    async def test_shared_browser_is_ref_counted(self):
+        with patch("tools.browser.SHARE_BROWSER", True):
+            first = await self.pool.acquire()
+            second = await self.pool.acquire()
+        self.assertIs(first, second)
+        self.assertEqual(self.pool._launch.await_count, 1)
+        self.assertEqual(self.pool._leased[first], 2)
+
+        await self.pool.release(first)
+        self.assertEqual(self.pool._leased[first], 1)
+        self.assertFalse(self.pool._idle)
+
+        await self.pool.release(first)
+        self.assertNotIn(first, self.pool._leased)
+        self.assertEqual([b for b, _ in self.pool._idle], [first])
+        first.close.assert_not_awaited()
+
+    async def test_exclusive_leases_reuse_idle_browser(self):
+        with patch("tools.browser.SHARE_BROWSER", False):
+            first = await self.pool.acquire()
+            second = await self.pool.acquire()
+            self.assertIsNot(first, second)
+            self.assertEqual(self.pool._leased, {first: 1, second: 1})
+
+            await self.pool.release(first)
+            third = await self.pool.acquire()
+        self.assertIs(third, first)
+        self.assertEqual(self.pool._launch.await_count, 2)
+
+    async def test_dead_browser_is_closed_not_pooled(self):
+        with patch("tools.browser.SHARE_BROWSER", False):
+            browser = await self.pool.acquire()
+        browser.is_connected.return_value = False
+        await self.pool.release(browser)
+        browser.close.assert_awaited_once()
+        self.assertFalse(self.pool._idle)
+        self.assertFalse(self.pool._leased)
+
+    async def test_surplus_browser_beyond_max_is_closed(self):
+        with patch("tools.browser.SHARE_BROWSER", False):
+            browsers = [await self.pool.acquire() for _ in range(3)]
+        for browser in browsers:
+            await self.pool.release(browser)
+        self.assertEqual(len(self.pool._idle), 2)
+        browsers[2].close.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
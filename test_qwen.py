@@ -2,10 +2,47 @@ import os
 import requests
 import json
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables
 load_dotenv()
 
+# One pooled keep-alive session: repeated diagnostics skip the TCP/TLS handshake
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+# (connect, read) timeouts so a stalled endpoint cannot hang the diagnostic
+REQUEST_TIMEOUT = (3, 30)
+
+# Every image is sent in ONE chat message so TLS and model warm-up are paid once per batch
+IMAGE_URLS = [
+    "https://cdn.britannica.com/61/93061-050-99147DCE/Statue-of-Liberty-Island-New-York-Bay.jpg",
+]
+
+def _iter_stream_tokens(response):
+    """Yields content deltas from an OpenAI-style SSE stream (or a plain JSON body)."""
+    if "text/event-stream" not in response.headers.get("Content-Type", ""):
+        # Endpoint ignored stream=True and answered in one piece
+        yield response.json()['choices'][0]['message']['content']
+        return
+    # SSE is UTF-8 by spec; without an explicit charset requests would yield raw bytes
+    response.encoding = response.encoding or "utf-8"
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+        chunk = line[len("data:"):].strip()
+        if chunk == "[DONE]":
+            break
+        choices = json.loads(chunk).get('choices') or []
+        if choices:
+            token = (choices[0].get('delta') or {}).get('content')
+            if token:
+                yield token
+
 def test_qubrid_multimodal():
     # Fetch from .env
     url = os.getenv("QUBRID_BASE_URL")
@@ -21,42 +58,48 @@ def test_qubrid_multimodal():
         "Content-Type": "application/json"
     }
 
-    # Test payload with a public image to verify vision logic
+    # Test payload with public images to verify vision logic: one text instruction,
+    # N image parts, N labeled answer lines back
+    content = [
+        {
+            "type": "text",
+            "text": (
+                f"You are given {len(IMAGE_URLS)} image(s). Describe each image in one sentence, "
+                "one line per image, formatted as 'Image <n>: <description>'."
+            )
+        }
+    ]
+    content.extend({"type": "image_url", "image_url": {"url": image_url}} for image_url in IMAGE_URLS)
+
     data = {
         "model": model,
         "messages": [
             {
                 "role": "user", 
-                "content": [
-                    {
-                        "type": "text", 
-                        "text": "Describe this image in one sentence."
-                    },
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": "https://cdn.britannica.com/61/93061-050-99147DCE/Statue-of-Liberty-Island-New-York-Bay.jpg"
-                        }
-                    }
-                ]
+                "content": content
             }
         ],
         "temperature": 0.7,
-        "max_tokens": 100,
-        "stream": False
+        "max_tokens": 100 * len(IMAGE_URLS),
+        "stream": True
     }
 
     try:
         print("[*] Contacting Qubrid Multimodal Engine...")
-        response = requests.post(url, headers=headers, json=data)
-        
-        if response.status_code == 200:
-            result = response.json()
-            answer = result['choices'][0]['message']['content']
-            print(f"\n[SUCCESS] API Vision Response: {answer}")
-        else:
-            print(f"\n[FAILED] Status Code: {response.status_code}")
-            print(f"Response Body: {response.text}")
+        with SESSION.post(url, headers=headers, json=data, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            if response.status_code == 200:
+                print("\n[SUCCESS] API Vision Response: ", end="", flush=True)
+                # Tokens are printed as they arrive: time-to-first-token, not total latency
+                answer = []
+                for token in _iter_stream_tokens(response):
+                    answer.append(token)
+                    print(token, end="", flush=True)
+                print()
+                if not answer:
+                    print("[WARN] Stream closed without any content.")
+            else:
+                print(f"\n[FAILED] Status Code: {response.status_code}")
+                print(f"Response Body: {response.text}")
             
     except Exception as e:
         print(f"\n[CRITICAL] Script Error: {str(e)}")
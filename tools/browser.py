@@ -1,12 +1,508 @@
 import asyncio
-import base64
+import contextlib
+try:
+    # SIMD (libbase64) codec with the stdlib's API; large screenshot frames encode/decode much faster
+    import pybase64 as base64
+except ImportError:
+    import base64
 import os
 import logging
 import random
 import time
-from typing import Optional, Dict, List
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
-from config import logger, SCREENSHOT_PATH, VIEWPORT_WIDTH, VIEWPORT_HEIGHT
+import io
+import re
+import uuid
+import weakref
+from collections import OrderedDict, deque
+from typing import Optional, Dict, List, Tuple, Union
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, CDPSession
+from config import (
+    logger, SCREENSHOT_PATH, DEBUG_SCREENSHOTS, MAX_CACHED_FRAMES,
+    SCREENSHOT_FORMAT, SCREENSHOT_QUALITY, SCREENSHOT_MAX_DIM, VIEWPORT_WIDTH, VIEWPORT_HEIGHT,
+    USER_AGENT, BROWSER_LAUNCH_ARGS, CONTEXT_POOL_SIZE,
+    POOL_MIN_SIZE, POOL_MAX_SIZE, POOL_IDLE_TIMEOUT, SHARE_BROWSER,
+    BLOCK_TRACKERS, BLOCKED_DOMAINS
+)
+
+# Opaque handle to a captured frame held by ArvynBrowser (see `capture`/`encode`/`release`)
+ScreenshotRef = str
+
+# Stealth init script, registered once per context (contexts apply it to every new page)
+_STEALTH_JS = """
+    Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+    window.devicePixelRatio = 1;
+"""
+
+# Navigation settle probe: a compact {ready, len} result instead of polling content from Python
+_SETTLE_PROBE_JS = """
+    ({ minText, graceMs }) => {
+        const ready = document.readyState;
+        const len = document.body ? document.body.innerText.length : 0;
+        return ready === 'complete' && (len > minText || performance.now() > graceMs) ? { ready, len } : false;
+    }
+"""
+_SETTLE_ARGS = {"minText": 500, "graceMs": 3750}
+
+# Resolves after two animation frames (a fully committed paint); setTimeout caps it when rAF is throttled
+_TWO_FRAMES_JS = "() => new Promise(r => { requestAnimationFrame(() => requestAnimationFrame(r)); setTimeout(r, 500); })"
+
+# A click-started navigation issues its main-frame request within a frame or two (grace counts after the
+# two-frame settle); later JS-driven navigations are left to the next capture's load-state wait
+_NAV_START_GRACE = 0.15
+_NAV_LOAD_TIMEOUT = 10
+
+# Same settle, resolving with the scroll offset a page-coordinate CDP clip needs (saves a getLayoutMetrics call)
+_FRAME_OFFSET_JS = """
+    () => new Promise(r => {
+        const done = () => {
+            const vv = window.visualViewport;
+            r(vv ? [vv.pageLeft, vv.pageTop] : [window.scrollX, window.scrollY]);
+        };
+        requestAnimationFrame(() => requestAnimationFrame(done));
+        setTimeout(done, 500);
+    })
+"""
+
+# Resolves once scrollY holds still for two frames (smooth scroll finished), capped at 1s
+_SCROLL_SETTLED_JS = """
+    () => new Promise(resolve => {
+        let last = -1, still = 0;
+        const tick = () => {
+            const y = window.scrollY;
+            still = y === last ? still + 1 : 0;
+            last = y;
+            if (still >= 2) resolve(); else requestAnimationFrame(tick);
+        };
+        requestAnimationFrame(tick);
+        setTimeout(resolve, 1000);
+    })
+"""
+
+# An enabled Verify control is present (async VPA validation re-enables it once the ID checks out)
+_VERIFY_READY_JS = """
+    () => Array.from(document.querySelectorAll('button, [role="button"], input[type="button"], input[type="submit"]')).some(el => {
+        const txt = (el.innerText || el.value || el.getAttribute('aria-label') || '').toLowerCase();
+        return txt.includes('verify') && !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+    })
+"""
+
+# Same match rule as fill_upi_details' PIN search, without the side effects
+_PIN_FIELD_JS = """
+    () => Array.from(document.querySelectorAll('input')).some(el => {
+        const txt = ((el.placeholder||'') + ' ' + (el.name||'') + ' ' + (el.id||'') + ' ' + (el.getAttribute('aria-label')||'')).toLowerCase();
+        return (txt.includes('pin') || txt.includes('pass') || el.type === 'password') && !txt.includes('upi');
+    })
+"""
+
+# Tracker hosts (and their subdomains). Routed by pattern so only these requests ever reach
+# Python; images/fonts stay untouched because the VLM reads them off the screenshot.
+_TRACKER_RE = re.compile(
+    r"^https?://([^/?#]+\.)?(" + "|".join(map(re.escape, BLOCKED_DOMAINS)) + r")(?::\d+)?(?:[/?#]|$)"
+) if BLOCKED_DOMAINS else None
+
+# Semantic action core (shadow-DOM search, drift correction, event dispatch)
+_STEALTH_ACTION_JS = """
+    (params) => {
+        const { hint, x, y, action, mark } = params;
+        const search = (hint || '').toLowerCase().trim();
+
+        function collectInteractiveElements(root, observer) {
+            const selector = 'button, a, input, [role="button"], label, select, textarea, [data-action]';
+            let found = Array.from(root.querySelectorAll(selector));
+            // Traverse shadow roots recursively
+            const all = Array.from(root.querySelectorAll('*'));
+            for (const el of all) {
+                if (el.shadowRoot) {
+                    // Document-level observers don't see inside shadow trees: watch each one found
+                    if (observer) { try { observer.observe(el.shadowRoot, { childList: true, subtree: true }); } catch(e) {} }
+                    try { found = found.concat(collectInteractiveElements(el.shadowRoot, observer)); } catch(e) {}
+                }
+            }
+            return found;
+        }
+
+        // The element list only changes with the DOM: keep it until a mutation invalidates it,
+        // so repeat clicks skip the full-tree shadow-root walk. Boxes are still read live below,
+        // since scrolling and layout shifts move elements without mutating anything.
+        function interactiveElements() {
+            let cache = window.__arvynInteractive;
+            if (!cache && typeof MutationObserver === 'function' && document.documentElement) {
+                cache = { els: null };
+                cache.observer = new MutationObserver(() => { cache.els = null; });
+                cache.observer.observe(document.documentElement, {
+                    childList: true, subtree: true, attributes: true, attributeFilter: ['role', 'data-action']
+                });
+                Object.defineProperty(window, '__arvynInteractive', { value: cache, enumerable: false });
+            }
+            if (!cache) return collectInteractiveElements(document, null);
+            if (!cache.els) cache.els = collectInteractiveElements(document, cache.observer);
+            return cache.els;
+        }
+
+        let target = null;
+        let min_dist = Infinity;
+
+        try {
+            const els = interactiveElements();
+            for (const el of els) {
+                const text = (el.innerText || el.value || el.placeholder || el.getAttribute('aria-label') || '').toLowerCase();
+                const normalized = text.replace(/\s+/g, ' ').trim();
+                if (search && normalized.includes(search)) {
+                    const rect = el.getBoundingClientRect();
+                    if (rect.width > 0 && rect.height > 0) {
+                        const dx = (rect.left + rect.width/2) - x;
+                        const dy = (rect.top + rect.height/2) - y;
+                        const dist = Math.sqrt(dx*dx + dy*dy);
+                        if (dist < min_dist) { min_dist = dist; target = el; }
+                    }
+                }
+            }
+        } catch(e) { }
+
+        if (!target) {
+            // Fallback: try elementsFromPoint stack
+            try {
+                const stack = document.elementsFromPoint(x, y);
+                for (const el of stack) {
+                    const interactive = el.closest('button, a, input, [role="button"], select, textarea');
+                    if (interactive) { target = interactive; break; }
+                }
+            } catch(e) { }
+        }
+
+        if (target) {
+            try {
+                target.scrollIntoView({behavior: 'auto', block: 'center', inline: 'center'});
+            } catch(e) {}
+            const rect = target.getBoundingClientRect();
+            const centerX = Math.floor(rect.left + rect.width / 2);
+            const centerY = Math.floor(rect.top + rect.height / 2);
+
+            if (mark && window.__arvynMark) {
+                try { window.__arvynMark(target, centerX, centerY); } catch(e) {}
+            }
+
+            try { target.focus(); } catch(e) {}
+
+            const evtOpts = { bubbles: true, cancelable: true, composed: true, clientX: centerX, clientY: centerY };
+            if (action === 'click') {
+                try {
+                    target.dispatchEvent(new PointerEvent('pointerdown', evtOpts));
+                    target.dispatchEvent(new PointerEvent('pointerup', evtOpts));
+                    target.dispatchEvent(new MouseEvent('mousedown', evtOpts));
+                    target.dispatchEvent(new MouseEvent('mouseup', evtOpts));
+                    target.dispatchEvent(new MouseEvent('click', evtOpts));
+                } catch(e) {
+                    try { target.click(); } catch(e) {}
+                }
+            }
+
+            return { x: centerX, y: centerY, name: (target.tagName || '').toLowerCase(), found: true };
+        }
+
+        // As a diagnostic fallback, return the top stacked elements at the point
+        let stackInfo = [];
+        try {
+            const stack = document.elementsFromPoint(x, y);
+            stackInfo = stack.slice(0,5).map(el => ({ tag: el.tagName, className: el.className || '', rect: el.getBoundingClientRect() }));
+        } catch(e) { }
+
+        return { x, y, found: false, stack: stackInfo };
+    }
+"""
+
+# Fuzzy visible-text click (used by find_and_click_text)
+_CLICK_TEXT_JS = """
+    (t) => {
+        function levenshtein(a,b){if(!a||!b) return 1e9; a=a+'', b=b+''; const m=a.length, n=b.length; const d=[]; for(let i=0;i<=m;i++){d[i]=[i];} for(let j=1;j<=n;j++) d[0][j]=j; for(let i=1;i<=m;i++){for(let j=1;j<=n;j++){const cost = a[i-1]===b[j-1]?0:1; d[i][j]=Math.min(d[i-1][j]+1,d[i][j-1]+1,d[i-1][j-1]+cost);}} return d[m][n];}
+        const search = (t||'').toLowerCase().trim();
+        const elems = Array.from(document.querySelectorAll('a, button, [role="button"], span, div, label'));
+        let best=null; let bestScore=1e9;
+        for(const el of elems){
+            const txt = (el.innerText||el.textContent||'').toLowerCase().trim();
+            if(!txt) continue;
+            if(txt.includes(search) && search.length>0){
+                best = el; bestScore = 0; break;
+            }
+            const score = levenshtein(txt, search);
+            if(score < bestScore && score <= Math.max(1, Math.floor(search.length*0.35))){ best=el; bestScore=score; }
+        }
+        if(best){ try{ best.scrollIntoView({behavior:'auto', block:'center'}); }catch(e){}
+            try{ best.click(); }catch(e){ try{ best.dispatchEvent(new MouseEvent('click',{bubbles:true, cancelable:true})); }catch(e){} }
+            return true;
+        }
+        return false;
+    }
+"""
+
+# Fuzzy <select>/menu option picker (used by select_option_by_text)
+_SELECT_OPTION_JS = """
+    (params) => {
+        function levenshtein(a,b){if(!a||!b) return 1e9; a=a+'', b=b+''; const m=a.length, n=b.length; const d=[]; for(let i=0;i<=m;i++){d[i]=[i];} for(let j=1;j<=n;j++) d[0][j]=j; for(let i=1;i<=m;i++){for(let j=1;j<=n;j++){const cost = a[i-1]===b[j-1]?0:1; d[i][j]=Math.min(d[i-1][j]+1,d[i][j-1]+1,d[i-1][j-1]+cost);}} return d[m][n];}
+        const { hint, option } = params;
+        const search = (hint||'').toLowerCase().trim();
+        const opt = (option||'').toLowerCase().trim();
+        const selects = Array.from(document.querySelectorAll('select, [role="listbox"], [role="menu"]'));
+        for (const s of selects) {
+            const label = (s.innerText||'').toLowerCase();
+            if (!search || label.includes(search) || levenshtein(label, search) <= Math.max(1, Math.floor(search.length*0.35))) {
+                // attempt native select
+                if (s.tagName.toLowerCase() === 'select') {
+                    let best=null; let bestScore=1e9;
+                    for (const o of Array.from(s.options || [])) {
+                        const txt = (o.text||'').toLowerCase().trim();
+                        if(txt.includes(opt)) { s.value = o.value; s.dispatchEvent(new Event('change',{bubbles:true})); return true; }
+                        const score = levenshtein(txt, opt);
+                        if(score < bestScore){ bestScore = score; best = o; }
+                    }
+                    if(best && bestScore <= Math.max(1, Math.floor(opt.length*0.35))){ s.value = best.value; s.dispatchEvent(new Event('change',{bubbles:true})); return true; }
+                }
+                try { s.click(); } catch(e) {}
+                const items = Array.from(document.querySelectorAll('[role="option"], [role="menuitem"], li'));
+                let bestIt=null; let bestScore=1e9;
+                for (const it of items) {
+                    const txt = (it.innerText||'').toLowerCase().trim();
+                    if(txt.includes(opt)) { try{ it.click(); }catch(e){ it.dispatchEvent(new MouseEvent('click',{bubbles:true})); } return true; }
+                    const score = levenshtein(txt, opt);
+                    if(score < bestScore){ bestScore = score; bestIt = it; }
+                }
+                if(bestIt && bestScore <= Math.max(1, Math.floor(opt.length*0.35))){ try{ bestIt.click(); }catch(e){ bestIt.dispatchEvent(new MouseEvent('click',{bubbles:true})); } return true; }
+            }
+        }
+        return false;
+    }
+"""
+
+# Helpers installed once per document (non-enumerable) so calls ship a name + args, not source
+_PAGE_HELPERS = {
+    "__arvynAct": _STEALTH_ACTION_JS,
+    "__arvynClickText": _CLICK_TEXT_JS,
+    "__arvynSelect": _SELECT_OPTION_JS,
+}
+_HELPERS_INIT_JS = "".join(
+    f"Object.defineProperty(window, '{name}', {{ value: {src.strip()}, enumerable: false }});"
+    for name, src in _PAGE_HELPERS.items()
+)
+
+# Fast path: call the pre-installed helper; null means this document predates it (use the full source)
+_HELPER_CALL_JS = "([name, arg]) => (typeof window[name] === 'function' ? window[name](arg) : null)"
+
+# Visual debugging anchors (marker helper + highlight styles); only useful with a visible window
+_VISUAL_JS = """
+    (() => {
+        // Scoped: top-level const/let here would collide with same-named page globals
+        // Visual target marker, compiled once per document instead of per click.
+        // The crosshair fades via CSS; one shared sweep (running only while marks exist)
+        // removes expired marks instead of a timer per click.
+        const arvynMarks = [];
+        let arvynSweep = null;
+        const sweepMarks = () => {
+            const now = performance.now();
+            while (arvynMarks.length && arvynMarks[0].until <= now) {
+                const { el, cross } = arvynMarks.shift();
+                el.classList.remove('arvyn-target-highlight');
+                cross.remove();
+            }
+            if (!arvynMarks.length) { clearInterval(arvynSweep); arvynSweep = null; }
+        };
+        window.__arvynMark = (el, x, y) => {
+            el.classList.add('arvyn-target-highlight');
+            const cross = document.createElement('div');
+            cross.className = 'arvyn-crosshair';
+            cross.style.left = x + 'px';
+            cross.style.top = y + 'px';
+            document.body.appendChild(cross);
+            arvynMarks.push({ el, cross, until: performance.now() + 2000 });
+            if (!arvynSweep) arvynSweep = setInterval(sweepMarks, 500);
+        };
+    
+        const style = document.createElement('style');
+        style.innerHTML = `
+            .arvyn-target-highlight {
+                outline: 5px solid #00d2ff !important;
+                outline-offset: 3px !important;
+                transition: outline 0.1s ease-in-out !important;
+                z-index: 2147483646 !important;
+            }
+            .arvyn-crosshair {
+                position: fixed;
+                width: 40px;
+                height: 40px;
+                border: 2px solid #FF0000;
+                border-radius: 50%;
+                pointer-events: none;
+                z-index: 2147483647;
+                transform: translate(-50%, -50%);
+                box-shadow: 0 0 15px rgba(255,0,0,0.8);
+                animation: arvyn-fade 2s ease-in forwards;
+            }
+            @keyframes arvyn-fade {
+                from { opacity: 1; }
+                to { opacity: 0; }
+            }
+        `;
+        // Init scripts run before <head> exists: attach once the DOM is parsed
+        const attachStyle = () => (document.head || document.documentElement).appendChild(style);
+        if (document.readyState === 'loading') {
+            document.addEventListener('DOMContentLoaded', attachStyle, { once: true });
+        } else {
+            attachStyle();
+        }
+    })();
+"""
+
+class _NavigationWatch:
+    """Flags a main-frame navigation, and the new document's DOMContentLoaded, from the moment it is armed."""
+
+    def __init__(self, page: Page):
+        self._page = page
+        self.started = asyncio.Event()
+        self.loaded = asyncio.Event()
+        page.on("request", self._on_request)
+        page.on("domcontentloaded", self._on_dom)
+
+    def _on_request(self, request):
+        if request.is_navigation_request() and request.frame == self._page.main_frame:
+            self.started.set()
+            self.loaded.clear()  # Redirects and re-navigations wait for the latest document
+
+    def _on_dom(self, _page):
+        if self.started.is_set():
+            self.loaded.set()
+
+    def disarm(self):
+        self._page.remove_listener("request", self._on_request)
+        self._page.remove_listener("domcontentloaded", self._on_dom)
+
+
+class BrowserPool:
+    """
+    Launched Chromium processes leased to ArvynBrowser sessions on one event loop.
+    UPGRADED: A session reuses an already-running browser instead of paying the multi-second launch each time.
+    Each session still opens its own BrowserContext, so cookies and storage never leak between leases.
+    With SHARE_BROWSER, concurrent sessions share one process too (leases are ref-counted).
+    """
+    # Playwright objects are bound to their event loop: one pool per (loop, headless)
+    _pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[bool, BrowserPool]]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, headless: bool):
+        self.headless = headless
+        self.playwright = None
+        self._idle: deque = deque()  # (browser, released_at), oldest first
+        self._leased: Dict[Browser, int] = {}  # browser -> active sessions
+        self._lock = asyncio.Lock()
+        self._reaper: Optional[asyncio.Task] = None
+        self._warmer: Optional[asyncio.Task] = None
+        self._shutting_down = False
+
+    @classmethod
+    def get(cls, headless: bool) -> "BrowserPool":
+        pools = cls._pools.setdefault(asyncio.get_running_loop(), {})
+        if headless not in pools:
+            pools[headless] = cls(headless)
+        return pools[headless]
+
+    @classmethod
+    async def shutdown_all(cls):
+        """Closes every pooled browser on the running loop (call once at process/worker exit)."""
+        pools = cls._pools.pop(asyncio.get_running_loop(), {})
+        await asyncio.gather(*(pool.shutdown() for pool in pools.values()), return_exceptions=True)
+
+    async def _launch(self) -> Browser:
+        if not self.playwright:
+            self.playwright = await async_playwright().start()
+        return await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=[f"--window-size={VIEWPORT_WIDTH},{VIEWPORT_HEIGHT}", *BROWSER_LAUNCH_ARGS]
+        )
+
+    async def acquire(self) -> Browser:
+        """Leases a healthy idle browser, launching one only if none is available."""
+        async with self._lock:
+            browser = None
+            if SHARE_BROWSER:
+                # A context is a few MB; a second Chromium process tree is hundreds
+                browser = next((b for b in self._leased if b.is_connected()), None)
+            while browser is None and self._idle:
+                candidate, _ = self._idle.pop()  # Most recently used first
+                if candidate.is_connected():
+                    browser = candidate
+                    break
+            if browser is None:
+                browser = await self._launch()
+            self._leased[browser] = self._leased.get(browser, 0) + 1
+        self._schedule_warm()
+        return browser
+
+    async def release(self, browser: Browser):
+        """Returns a leased browser; dead or surplus browsers are closed instead of kept."""
+        remaining = self._leased.pop(browser, 1) - 1
+        if remaining > 0 and browser.is_connected():
+            self._leased[browser] = remaining  # Still serving other sessions
+            return
+        if browser.is_connected() and len(self._idle) < POOL_MAX_SIZE:
+            self._idle.append((browser, time.monotonic()))
+            if self._reaper is None or self._reaper.done():
+                self._reaper = asyncio.create_task(self._idle_cleanup())
+            return
+        await self._close_browser(browser)
+        if not self._idle and not self._leased:
+            await self._stop_driver()
+
+    def _schedule_warm(self):
+        if POOL_MIN_SIZE > len(self._idle) and (self._warmer is None or self._warmer.done()):
+            self._warmer = asyncio.create_task(self._warm())
+
+    async def _warm(self):
+        try:
+            while len(self._idle) < POOL_MIN_SIZE:
+                async with self._lock:
+                    self._idle.appendleft((await self._launch(), time.monotonic()))
+        except Exception as e:
+            logger.debug(f"[BROWSER] Pool warm-up stopped: {e}")
+
+    async def _idle_cleanup(self):
+        """Reaps browsers idle past POOL_IDLE_TIMEOUT (down to POOL_MIN_SIZE) and dead ones."""
+        try:
+            while self._idle:
+                await asyncio.sleep(POOL_IDLE_TIMEOUT)
+                cutoff = time.monotonic() - POOL_IDLE_TIMEOUT
+                async with self._lock:
+                    # deque is oldest-first: expire from the left
+                    while self._idle and (not self._idle[0][0].is_connected() or
+                                          (len(self._idle) > POOL_MIN_SIZE and self._idle[0][1] < cutoff)):
+                        browser, _ = self._idle.popleft()
+                        await self._close_browser(browser)
+        except asyncio.CancelledError:
+            # Loop teardown (e.g. asyncio.run exiting): don't orphan Chromium processes
+            if not self._shutting_down:
+                await self.shutdown()
+            raise
+
+    @staticmethod
+    async def _close_browser(browser: Browser):
+        try:
+            await asyncio.wait_for(browser.close(), timeout=3.0)
+        except Exception as e:
+            logger.debug(f"[BROWSER] Pooled browser close skipped: {e}")
+
+    async def shutdown(self):
+        self._shutting_down = True
+        for task in (self._reaper, self._warmer):
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+        browsers = [b for b, _ in self._idle] + list(self._leased)
+        self._idle.clear()
+        self._leased.clear()
+        await asyncio.gather(*(self._close_browser(b) for b in browsers))
+        await self._stop_driver()
+
+    async def _stop_driver(self):
+        # Detach first so a concurrent shutdown (e.g. the cancelled reaper) can't stop it twice
+        playwright, self.playwright = self.playwright, None
+        if playwright:
+            await playwright.stop()
+
 
 class ArvynBrowser:
     """
@@ -16,186 +512,192 @@ class ArvynBrowser:
     PRESERVED: All visual debuggers, crosshairs, stealth args, and DPI locking.
     """
     
-    def __init__(self, headless: bool = False):
-        self.playwright = None
+    def __init__(self, headless: bool = False, storage_state: Optional[str] = None):
+        self._pool: Optional[BrowserPool] = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        self.headless = headless
         self.viewport_width = VIEWPORT_WIDTH
         self.viewport_height = VIEWPORT_HEIGHT
+        self._context_options = {
+            "viewport": {'width': self.viewport_width, 'height': self.viewport_height},
+            "user_agent": USER_AGENT,
+            "device_scale_factor": 1,
+            "has_touch": True,
+            "is_mobile": False
+        }
+        # Optional login persistence: restored into every context, re-saved on close
+        self.storage_state = storage_state
+        if storage_state and os.path.exists(storage_state):
+            self._context_options["storage_state"] = storage_state
+        # Warm spare contexts (init script already installed) for fast page/context recovery
+        # (context, about:blank page); the page is only pre-opened headless, where it costs no window
+        self._context_pool: List[Tuple[BrowserContext, Optional[Page]]] = []
+        self._refill_task: Optional[asyncio.Task] = None
+        # Persistent CDP session for screenshots, bound to the page it was opened on
+        self._cdp: Optional[CDPSession] = None
+        self._cdp_page: Optional[Page] = None
+        # Strong refs to in-flight debug writes (tasks are otherwise GC-eligible)
+        self._pending_writes: set = set()
+        self._debug_dir_ready = False
+        # Encoder options, resolved once (quality is only valid for JPEG)
+        self._shot_opts = {"format": SCREENSHOT_FORMAT}
+        self._shot_kwargs = {"type": SCREENSHOT_FORMAT}
+        if SCREENSHOT_FORMAT == "jpeg":
+            self._shot_opts["quality"] = self._shot_kwargs["quality"] = SCREENSHOT_QUALITY
+        # Downscale factor for VLM frames (1.0 = native resolution)
+        longest = max(self.viewport_width, self.viewport_height)
+        self._shot_scale = min(1.0, SCREENSHOT_MAX_DIM / longest) if SCREENSHOT_MAX_DIM else 1.0
+        # The viewport is fixed per context, so the clip size is known up front; only the scroll offset varies
+        self._shot_clip = {"width": self.viewport_width, "height": self.viewport_height, "scale": self._shot_scale}
+        # ref -> base64 frame (straight from CDP, or encoded off-loop on the fallback path)
+        self._frames: "OrderedDict[ScreenshotRef, str]" = OrderedDict()
+        self.headless = headless
+        # Built once: a single add_init_script round trip per context
+        self._init_js = _STEALTH_JS + _HELPERS_INIT_JS + ("" if headless else _VISUAL_JS)
 
     async def start(self):
         """Initializes a hardened Chromium instance with scale-invariant window sizing."""
         if self.browser:
             return
 
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                f"--window-size={self.viewport_width},{self.viewport_height}",
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-web-security",
-                "--force-device-scale-factor=1",
-                "--high-dpi-support=1",
-                "--force-color-profile=srgb"
-            ]
-        )
+        # Lease a running Chromium from the pool; only the first session on this loop pays the launch
+        self._pool = BrowserPool.get(self.headless)
+        self.browser = await self._pool.acquire()
         
-        self.context = await self.browser.new_context(
-            viewport={'width': self.viewport_width, 'height': self.viewport_height},
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-            device_scale_factor=1,
-            has_touch=True,
-            is_mobile=False
-        )
-        
-        # INJECT: Superior Visual Debugging & Style Anchors
-        await self.context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-            window.devicePixelRatio = 1;
-            
-            const style = document.createElement('style');
-            style.innerHTML = `
-                .arvyn-target-highlight {
-                    outline: 5px solid #00d2ff !important;
-                    outline-offset: 3px !important;
-                    transition: outline 0.1s ease-in-out !important;
-                    z-index: 2147483646 !important;
-                }
-                .arvyn-crosshair {
-                    position: fixed;
-                    width: 40px;
-                    height: 40px;
-                    border: 2px solid #FF0000;
-                    border-radius: 50%;
-                    pointer-events: none;
-                    z-index: 2147483647;
-                    transform: translate(-50%, -50%);
-                    box-shadow: 0 0 15px rgba(255,0,0,0.8);
-                }
-            `;
-            document.head.appendChild(style);
-        """)
+        self.context = await self.browser.new_context(**self._context_options)
         
-        self.page = await self.context.new_page()
-        await self.page.set_viewport_size({"width": self.viewport_width, "height": self.viewport_height})
-        await self.page.goto("about:blank")
+        # INJECT: Superior Visual Debugging & Style Anchors (+ tracker blocking)
+        # Registered concurrently with page creation; both finish before the first real navigation.
+        # Viewport is already fixed by the context; no per-page set_viewport_size needed
+        _, self.page = await asyncio.gather(self._prepare_context(self.context), self.context.new_page())
+        # Blank navigation and CDP attach are independent: overlap them.
+        # The CDP session survives top-level navigations of this page.
+        nav, cdp = await asyncio.gather(
+            self.page.goto("about:blank"), self._get_cdp(self.page), return_exceptions=True
+        )
+        if isinstance(nav, Exception):
+            raise nav
+        if isinstance(cdp, Exception):
+            logger.debug(f"[BROWSER] CDP session unavailable: {cdp}")
+        if DEBUG_SCREENSHOTS and not self._debug_dir_ready:
+            # Cold path: keep directory checks out of the per-frame debug write
+            os.makedirs(SCREENSHOT_PATH, exist_ok=True)
+            self._debug_dir_ready = True
+        # Spare contexts are warmed after the first navigation (see navigate), not here,
+        # so they never compete with it
         
         logger.info(f"[BROWSER] Hardened Kinetic Engine v5.1 active.")
 
-    async def ensure_page(self) -> Page:
-        if not self.page or self.page.is_closed():
-            await self.start()
-        return self.page
+    async def _new_context(self) -> BrowserContext:
+        context = await self.browser.new_context(**self._context_options)
+        await self._prepare_context(context)
+        return context
 
-    async def _execute_stealth_action(self, hint: str, x: int, y: int, action: str = "click"):
+    async def _new_spare(self) -> Tuple[BrowserContext, Optional[Page]]:
         """
-        INTERNAL DOM MANIPULATION CORE.
-        Finds the best element and performs a direct JS injection action.
-        This bypasses mouse drift and overlays entirely.
+        Spare context for recovery. Headless, its tab is already open and blank, so recovery is a pointer swap.
+        Headed, a page would be an extra visible window stacked over the working one: the tab opens on lease.
         """
-        # Enhanced script: searches shadow DOM, scrolls element into view, and dispatches richer input events
-        script = """
-            (params) => {
-                const { hint, x, y, action } = params;
-                const search = (hint || '').toLowerCase().trim();
-
-                function collectInteractiveElements(root) {
-                    const selector = 'button, a, input, [role="button"], label, select, textarea, [data-action]';
-                    let found = Array.from(root.querySelectorAll(selector));
-                    // Traverse shadow roots recursively
-                    const all = Array.from(root.querySelectorAll('*'));
-                    for (const el of all) {
-                        if (el.shadowRoot) {
-                            try { found = found.concat(collectInteractiveElements(el.shadowRoot)); } catch(e) {}
-                        }
-                    }
-                    return found;
-                }
+        context = await self._new_context()
+        if not self.headless:
+            return context, None
+        page = await context.new_page()
+        await page.goto("about:blank")
+        return context, page
 
-                let target = null;
-                let min_dist = Infinity;
+    async def _lease_spare(self) -> Tuple[BrowserContext, Page]:
+        """Pops the freshest usable spare (LIFO), opening its tab if needed; builds one if none survive."""
+        while self._context_pool:
+            context, page = self._context_pool.pop()
+            try:
+                if page is None or page.is_closed():
+                    page = await context.new_page()
+                    await page.goto("about:blank")
+                return context, page
+            except Exception:
+                continue  # Spare died with its renderer: try the next one
+        context = await self._new_context()
+        page = await context.new_page()
+        await page.goto("about:blank")
+        return context, page
 
-                try {
-                    const els = collectInteractiveElements(document);
-                    for (const el of els) {
-                        const text = (el.innerText || el.value || el.placeholder || el.getAttribute('aria-label') || '').toLowerCase();
-                        const normalized = text.replace(/\s+/g, ' ').trim();
-                        if (search && normalized.includes(search)) {
-                            const rect = el.getBoundingClientRect();
-                            if (rect.width > 0 && rect.height > 0) {
-                                const dx = (rect.left + rect.width/2) - x;
-                                const dy = (rect.top + rect.height/2) - y;
-                                const dist = Math.sqrt(dx*dx + dy*dy);
-                                if (dist < min_dist) { min_dist = dist; target = el; }
-                            }
-                        }
-                    }
-                } catch(e) { }
+    async def _prepare_context(self, context: BrowserContext):
+        """Per-context setup: init script and, if enabled, the tracker route."""
+        setup = [context.add_init_script(self._init_js)]
+        if BLOCK_TRACKERS and _TRACKER_RE is not None:
+            setup.append(context.route(_TRACKER_RE, self._abort_route))
+        await asyncio.gather(*setup)
 
-                if (!target) {
-                    // Fallback: try elementsFromPoint stack
-                    try {
-                        const stack = document.elementsFromPoint(x, y);
-                        for (const el of stack) {
-                            const interactive = el.closest('button, a, input, [role="button"], select, textarea');
-                            if (interactive) { target = interactive; break; }
-                        }
-                    } catch(e) { }
-                }
+    @staticmethod
+    async def _abort_route(route):
+        try:
+            await route.abort()
+        except Exception:
+            pass  # Request already finished or page gone
 
-                if (target) {
-                    try {
-                        target.scrollIntoView({behavior: 'auto', block: 'center', inline: 'center'});
-                    } catch(e) {}
-                    const rect = target.getBoundingClientRect();
-                    const centerX = Math.floor(rect.left + rect.width / 2);
-                    const centerY = Math.floor(rect.top + rect.height / 2);
+    def _schedule_pool_refill(self):
+        if len(self._context_pool) < CONTEXT_POOL_SIZE and (self._refill_task is None or self._refill_task.done()):
+            self._refill_task = asyncio.create_task(self._refill_pool())
 
-                    try {
-                        target.classList.add('arvyn-target-highlight');
-                        const cross = document.createElement('div');
-                        cross.className = 'arvyn-crosshair';
-                        cross.style.left = centerX + 'px';
-                        cross.style.top = centerY + 'px';
-                        document.body.appendChild(cross);
-                        setTimeout(() => { target.classList.remove('arvyn-target-highlight'); cross.remove(); }, 2000);
-                    } catch(e) {}
-
-                    try { target.focus(); } catch(e) {}
-
-                    const evtOpts = { bubbles: true, cancelable: true, composed: true, clientX: centerX, clientY: centerY };
-                    if (action === 'click') {
-                        try {
-                            target.dispatchEvent(new PointerEvent('pointerdown', evtOpts));
-                            target.dispatchEvent(new PointerEvent('pointerup', evtOpts));
-                            target.dispatchEvent(new MouseEvent('mousedown', evtOpts));
-                            target.dispatchEvent(new MouseEvent('mouseup', evtOpts));
-                            target.dispatchEvent(new MouseEvent('click', evtOpts));
-                        } catch(e) {
-                            try { target.click(); } catch(e) {}
-                        }
-                    }
+    async def _refill_pool(self):
+        try:
+            while self.browser and self.browser.is_connected() and len(self._context_pool) < CONTEXT_POOL_SIZE:
+                self._context_pool.append(await self._new_spare())
+        except Exception as e:
+            logger.debug(f"[BROWSER] Context pool refill stopped: {e}")
 
-                    return { x: centerX, y: centerY, name: (target.tagName || '').toLowerCase(), found: true };
-                }
+    async def ensure_page(self) -> Page:
+        """
+        Returns a live page, recovering from a lost page or browser.
+        FIXED: A closed page with a live browser no longer returns the dead page (start() was a no-op).
+        """
+        if self.page and not self.page.is_closed():
+            return self.page
 
-                // As a diagnostic fallback, return the top stacked elements at the point
-                let stackInfo = [];
-                try {
-                    const stack = document.elementsFromPoint(x, y);
-                    stackInfo = stack.slice(0,5).map(el => ({ tag: el.tagName, className: el.className || '', rect: el.getBoundingClientRect() }));
-                } catch(e) { }
+        if not self.browser or not self.browser.is_connected():
+            # Browser process is gone: hand it back (the pool drops dead ones) and lease another
+            logger.warning("[BROWSER] Browser disconnected. Relaunching...")
+            if self.browser:
+                await self._pool.release(self.browser)
+            self.browser = self.context = self.page = None
+            self._context_pool.clear()
+            await self.start()
+            return self.page
 
-                return { x, y, found: false, stack: stackInfo };
-            }
+        try:
+            # Page was closed but its context survives: a new tab is enough
+            page = await self.context.new_page()
+            await page.goto("about:blank")
+            self.page = page
+        except Exception:
+            # Context is unusable: swap in a warm spare from the pool
+            logger.warning("[BROWSER] Browser context lost. Recovering from pool...")
+            self.context, self.page = await self._lease_spare()
+            self._schedule_pool_refill()
+        if not self.headless:
+            # Once per swap (capture no longer does it per frame): other Arvyn windows may be stacked above
+            await self.page.bring_to_front()
+        return self.page
+
+    @staticmethod
+    async def _run_helper(target, name: str, arg):
+        """Calls a pre-installed page helper in a page or frame; ships its full source only as a fallback."""
+        result = await target.evaluate(_HELPER_CALL_JS, [name, arg])
+        if result is None:
+            result = await target.evaluate(_PAGE_HELPERS[name], arg)
+        return result
+
+    async def _execute_stealth_action(self, hint: str, x: int, y: int, action: str = "click"):
+        """
+        INTERNAL DOM MANIPULATION CORE.
+        Finds the best element and performs a direct JS injection action.
+        This bypasses mouse drift and overlays entirely.
         """
+        # Marker is purely visual: skip it when headless
+        params = {"hint": hint, "x": x, "y": y, "action": action, "mark": not self.headless}
         try:
-            result = await self.page.evaluate(script, {"hint": hint, "x": x, "y": y, "action": action})
+            result = await self._run_helper(self.page, "__arvynAct", params)
         except Exception as e:
             logger.error(f"[KINETIC] Visual Sync Script Error (main frame): {e}")
             result = {"x": x, "y": y, "found": False}
@@ -207,7 +709,7 @@ class ArvynBrowser:
                     try:
                         if frame == self.page.main_frame:
                             continue
-                        frame_result = await frame.evaluate(script, {"hint": hint, "x": x, "y": y, "action": action})
+                        frame_result = await self._run_helper(frame, "__arvynAct", params)
                         if frame_result and frame_result.get('found'):
                             # adjust coordinates relative to parent frame
                             result = frame_result
@@ -242,20 +744,31 @@ class ArvynBrowser:
                     page.get_by_text(clean_hint, exact=False)
                 ]
                 
-                for loc in strategies:
+                # Counts are read-only: resolve all strategies in one concurrent batch instead of
+                # one round trip each, then walk them in priority order
+                counts = await asyncio.gather(*(loc.count() for loc in strategies), return_exceptions=True)
+                for loc, count in zip(strategies, counts):
+                    if isinstance(count, Exception):
+                        continue
                     try:
-                        if await loc.count() > 0:
-                            # Iterate to find the first visible one
-                            count = await loc.count()
-                            for i in range(count):
-                                item = loc.nth(i)
-                                if await item.is_visible():
-                                    await item.scroll_into_view_if_needed()
-                                    # Flash for debugging
-                                    await item.evaluate("el => { el.style.outline = '3px solid #00ff00'; setTimeout(() => el.style.outline = '', 1000); }")
-                                    await item.click(timeout=1500)
-                                    await asyncio.sleep(0.5)
-                                    return True
+                        # Iterate to find the first visible one
+                        for i in range(count):
+                            item = loc.nth(i)
+                            if await item.is_visible():
+                                async with self._settle_click(page):
+                                    # click() scrolls into view as part of its actionability checks
+                                    if self.headless:
+                                        await item.click(timeout=1500)
+                                    else:
+                                        # Debug flash rides alongside the click instead of before it
+                                        _, clicked = await asyncio.gather(
+                                            item.evaluate("el => { el.style.outline = '3px solid #00ff00'; setTimeout(() => el.style.outline = '', 1000); }"),
+                                            item.click(timeout=1500),
+                                            return_exceptions=True
+                                        )
+                                        if isinstance(clicked, Exception):
+                                            raise clicked
+                                return True
                     except Exception:
                         continue
             except Exception as e:
@@ -276,66 +789,332 @@ class ArvynBrowser:
 
         try:
             # 2. Mouse Visual Consistency (For human observer/debugging)
-            await page.mouse.move(tx, ty, steps=15)
-            await asyncio.sleep(0.05)
+            # Interpolated moves are one CDP event per step: only worth it when someone can watch
+            await page.mouse.move(tx, ty, steps=1 if self.headless else 15)
             
             # 3. Native Click Fallback (Secondary assurance)
-            await page.mouse.click(tx, ty, delay=random.randint(50, 100))
-            
-            await asyncio.sleep(0.5)
+            async with self._settle_click(page):
+                await self._native_click(page, tx, ty, random.randint(50, 100))
             return True
         except Exception as e:
             logger.error(f"[KINETIC] Interaction failed: {e}")
             return False
 
-    async def type_text(self, text: str, clear: bool = True):
-        """Types text into the currently focused element, optionally clearing it first."""
+    async def click_target(self, target: Union[str, Tuple[int, int]], element_hint: str = ""):
+        """
+        Clicks a selector (any Playwright locator string, e.g. 'role=button[name="Pay"]') or an (x, y) point.
+        UPGRADED: Selector targets use one locator.click() (auto-wait + actionability) with no drift-correction evaluate.
+        Coordinates keep the full `click_at_coordinates` pipeline (hint locators, DOM sync, native click).
+        """
+        if isinstance(target, str):
+            page = await self.ensure_page()
+            try:
+                await page.locator(target).first.click(timeout=3000)
+                return True
+            except Exception as e:
+                logger.error(f"[KINETIC] Locator click failed for '{target}': {e}")
+                return False
+        x, y = target
+        return await self.click_at_coordinates(x, y, element_hint)
+
+    async def _native_click(self, page: Page, x: int, y: int, delay_ms: int):
+        """
+        Trusted press/release at (x, y) sent as raw CDP Input.dispatchMouseEvent on the cached session.
+        UPGRADED: The pointer is already there (mouse.move above), so this skips mouse.click's redundant move.
+        Falls back to Playwright's mouse API if the CDP session is unavailable.
+        """
+        event = {"x": x, "y": y, "button": "left", "clickCount": 1}
+        try:
+            cdp = await self._get_cdp(page)
+            await cdp.send("Input.dispatchMouseEvent", {"type": "mousePressed", **event})
+        except Exception as e:
+            logger.debug(f"[KINETIC] CDP click unavailable, using page.mouse: {e}")
+            self._cdp = None
+            # `delay` is the down/up dwell, timed in the driver
+            await page.mouse.click(x, y, delay=delay_ms)
+            return
+        await asyncio.sleep(delay_ms / 1000)
+        try:
+            await cdp.send("Input.dispatchMouseEvent", {"type": "mouseReleased", **event})
+        except Exception:
+            # Already pressed: only release (a full click here would press twice)
+            await page.mouse.up()
+
+    async def type_text(self, text: str, clear: bool = True, humanlike: bool = True):
+        """
+        Types text into the currently focused element, optionally clearing it first.
+        `humanlike=False` pastes the whole string in one Input.insertText (no per-key events or cadence).
+        """
         page = await self.ensure_page()
         try:
             if clear:
                 # Clear existing content using keyboard shortcuts
                 await page.keyboard.press("Control+A")
                 await page.keyboard.press("Backspace")
-                await asyncio.sleep(0.1)
+                await self._stabilize("input")
 
             logger.info(f"[KINETIC] Typing sequence: {len(text)} characters.")
-            for char in text:
-                await page.keyboard.type(char, delay=random.randint(30, 80))
+            if humanlike:
+                # One call: Playwright paces keystrokes itself instead of one round trip per char
+                await page.keyboard.type(text, delay=random.randint(30, 80))
+            else:
+                await page.keyboard.insert_text(text)
             return True
         except Exception as e:
             logger.error(f"[KINETIC] Input failure: {e}")
             return False
 
-    async def navigate(self, url: str):
+    async def navigate(self, url: str, ready_selector: Optional[str] = None):
+        """
+        Loads `url` and waits until it is usable.
+        UPGRADED: Callers that know the page can pass `ready_selector` to wait for exactly that element.
+        """
         page = await self.ensure_page()
         try:
             logger.info(f"[NETWORK] Navigating to: {url}")
-            await page.goto(url, wait_until="load", timeout=60000)
-            await page.wait_for_load_state("networkidle", timeout=10000)
-            await asyncio.sleep(2.0)
+            # networkidle never settles on pages with pollers/trackers; wait for the DOM instead
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            if ready_selector:
+                # Targeted readiness: the element the caller needs is the only signal that matters
+                try:
+                    await page.wait_for_selector(ready_selector, timeout=10000)
+                except Exception:
+                    logger.warning(f"[NETWORK] Ready selector not found: {ready_selector}")
+                return
+            # Event-driven settle instead of fixed buffers: one in-renderer probe returns as soon as
+            # the page is loaded with real content (sparse pages get a grace period, measured from
+            # navigation start), capped so a slow page can't stall the step.
+            # Polled on a timer rather than every animation frame: innerText forces layout
+            try:
+                await page.wait_for_function(_SETTLE_PROBE_JS, arg=_SETTLE_ARGS, timeout=5750, polling=100)
+            except Exception:
+                pass  # Long-tail subresources: the DOM is already usable
         except Exception as e:
             logger.error(f"[ERROR] Navigation Failed: {e}")
+        finally:
+            # Page is usable: only now warm recovery spares in the background (no-op once full)
+            self._schedule_pool_refill()
 
-    async def get_screenshot_b64(self) -> str:
+    async def _get_cdp(self, page: Page) -> CDPSession:
+        """Returns the cached CDP session, re-opening it only if the page was replaced."""
+        if self._cdp is None or self._cdp_page is not page:
+            self._cdp = await self.context.new_cdp_session(page)
+            self._cdp_page = page
+        return self._cdp
+
+    async def capture(self, save_debug: Optional[bool] = None) -> ScreenshotRef:
+        """
+        Captures the viewport (JPEG by default) and returns a lightweight frame reference.
+        UPGRADED: CDP Page.captureScreenshot returns base64 directly (no PNG encode, disk round-trip or re-encode).
+        Frames stay in a small LRU until `release`; base64 is only materialized by `encode`.
+        `save_debug` overrides DEBUG_SCREENSHOTS for this capture only.
+        """
         page = await self.ensure_page()
-        path = os.path.join(SCREENSHOT_PATH, "current_view.png")
-        if not os.path.exists(SCREENSHOT_PATH): os.makedirs(SCREENSHOT_PATH)
-        await page.bring_to_front()
-        await asyncio.sleep(0.5)
-        await page.screenshot(path=path)
-        with open(path, "rb") as img:
-            return base64.b64encode(img.read()).decode('utf-8')
+        # No per-frame bring_to_front: ensure_page raises a swapped-in page once, and Playwright launches
+        # Chromium with renderer backgrounding disabled, so the page paints (and rAF fires) without focus.
+        # Settle on real signals instead of a fixed 0.5s: DOM parsed, then two paints committed
+        offset = None
+        try:
+            await page.wait_for_load_state("domcontentloaded", timeout=5000)
+            offset = await page.evaluate(_FRAME_OFFSET_JS)
+        except Exception:
+            pass  # Navigating mid-capture: grab whatever is on screen
+        frame: str
+        try:
+            cdp = await self._get_cdp(page)
+            opts = {**self._shot_opts, "optimizeForSpeed": True}
+            if self._shot_scale < 1.0:
+                # Let the compositor render straight at VLM size; clip is in page coordinates
+                if offset is None:
+                    viewport = (await cdp.send("Page.getLayoutMetrics"))["cssVisualViewport"]
+                    offset = (viewport["pageX"], viewport["pageY"])
+                opts["clip"] = {"x": offset[0], "y": offset[1], **self._shot_clip}
+            shot = await cdp.send("Page.captureScreenshot", opts)
+            frame = shot["data"]  # Already base64
+        except Exception as e:
+            # Non-Chromium engine or detached session: fall back to Playwright's raw bytes
+            logger.debug(f"[BROWSER] CDP capture unavailable, using page.screenshot: {e}")
+            self._cdp = None
+            raw = await page.screenshot(**self._shot_kwargs)
+            # Resize + base64 in one worker hop so neither blocks the event loop
+            frame = await asyncio.to_thread(self._encode_raw, raw, self._shot_scale)
+
+        ref = uuid.uuid4().hex
+        self._frames[ref] = frame
+        while len(self._frames) > MAX_CACHED_FRAMES:
+            self._frames.popitem(last=False)
+
+        if DEBUG_SCREENSHOTS if save_debug is None else save_debug:
+            if not self._debug_dir_ready:
+                # Once per browser (a per-call save_debug may run before the folder exists)
+                os.makedirs(SCREENSHOT_PATH, exist_ok=True)
+                self._debug_dir_ready = True
+            # Disk copy is written off-loop while the caller ships the frame to the VLM
+            task = asyncio.create_task(asyncio.to_thread(
+                self._write_debug_frame, os.path.join(SCREENSHOT_PATH, f"current_view.{SCREENSHOT_FORMAT}"), frame
+            ))
+            self._pending_writes.add(task)
+            task.add_done_callback(self._pending_writes.discard)
+        return ref
+
+    @classmethod
+    def _encode_raw(cls, frame: bytes, scale: float) -> str:
+        """Fallback-path frame -> base64 (CPU-bound; run via asyncio.to_thread)."""
+        if scale < 1.0:
+            frame = cls._downscale(frame, scale)
+        return base64.b64encode(frame).decode('utf-8')
+
+    @staticmethod
+    def _downscale(frame: bytes, scale: float) -> bytes:
+        """Pillow resize for the non-CDP path; returns the frame untouched if Pillow is missing."""
+        try:
+            from PIL import Image
+        except ImportError:
+            return frame
+        img = Image.open(io.BytesIO(frame))
+        img = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))), Image.LANCZOS)
+        out = io.BytesIO()
+        if SCREENSHOT_FORMAT == "jpeg":
+            img.convert("RGB").save(out, "JPEG", quality=SCREENSHOT_QUALITY)
+        else:
+            img.save(out, SCREENSHOT_FORMAT.upper())
+        return out.getvalue()
+
+    def encode(self, ref: ScreenshotRef) -> str:
+        """Base64 for a captured frame; every path stores base64 already, so this never encodes on-loop."""
+        return self._frames[ref]
+
+    def release(self, ref: ScreenshotRef):
+        """Drops a frame once its consumer (e.g. the VLM request) is done with it."""
+        self._frames.pop(ref, None)
+
+    async def get_screenshot_b64(self, save_debug: Optional[bool] = None) -> str:
+        """Backward-compatible capture + encode + release in one call."""
+        ref = await self.capture(save_debug)
+        try:
+            return self.encode(ref)
+        finally:
+            self.release(ref)
+
+    async def get_screenshot_clip_b64(self, x: int, y: int, width: int, height: int) -> str:
+        """
+        Base64 frame of a viewport region (CSS pixels, viewport coordinates) at native resolution.
+        UPGRADED: Rasterizes only the clip; meant for close-up checks around a target, not landmark frames.
+        """
+        page = await self.ensure_page()
+        try:
+            cdp = await self._get_cdp(page)
+            # CDP clips are in page coordinates: offset by the current scroll position
+            viewport = (await cdp.send("Page.getLayoutMetrics"))["cssVisualViewport"]
+            shot = await cdp.send("Page.captureScreenshot", {
+                **self._shot_opts, "optimizeForSpeed": True,
+                "clip": {"x": viewport["pageX"] + x, "y": viewport["pageY"] + y,
+                         "width": width, "height": height, "scale": 1}
+            })
+            return shot["data"]
+        except Exception as e:
+            logger.debug(f"[BROWSER] CDP clip unavailable, using page.screenshot: {e}")
+            self._cdp = None
+            raw = await page.screenshot(clip={"x": x, "y": y, "width": width, "height": height}, **self._shot_kwargs)
+            return await asyncio.to_thread(self._encode_raw, raw, 1.0)
+
+    @staticmethod
+    def _write_debug_frame(path: str, frame: Union[str, bytes]):
+        try:
+            with open(path, "wb") as img:
+                img.write(base64.b64decode(frame) if isinstance(frame, str) else frame)
+        except OSError as e:
+            logger.debug(f"[BROWSER] Debug frame write failed: {e}")
+
+    @contextlib.asynccontextmanager
+    async def _settle_click(self, page: Page):
+        """
+        Wraps a click: navigation is watched from before the click, then `_stabilize("click")` runs.
+        FIXED: The old domcontentloaded wait resolved at once on the already-loaded document.
+        """
+        watch = _NavigationWatch(page)
+        try:
+            yield
+            await self._stabilize("click", watch)
+        finally:
+            watch.disarm()
+
+    async def _stabilize(self, kind: str, nav: Optional[_NavigationWatch] = None):
+        """
+        Event-driven settle after an action ("click", "input" or "scroll"), replacing fixed sleep buffers.
+        Each wait returns as soon as its signal fires and is capped so a quiet page can't stall.
+        """
+        page = self.page
+        if page is None or page.is_closed():
+            return
+        try:
+            # Handlers ran and painted (scroll: the smooth scroll stopped moving)
+            await page.evaluate(_SCROLL_SETTLED_JS if kind == "scroll" else _TWO_FRAMES_JS)
+        except Exception:
+            pass  # Execution context destroyed by a navigation the action started
+        if nav is None:
+            return
+        try:
+            # Only a click that actually started a navigation waits for the new DOM
+            await asyncio.wait_for(nav.started.wait(), _NAV_START_GRACE)
+        except asyncio.TimeoutError:
+            return
+        try:
+            await asyncio.wait_for(nav.loaded.wait(), _NAV_LOAD_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.debug("[BROWSER] Click navigation did not reach DOMContentLoaded in time.")
 
     async def scroll_to(self, x: int, y: int):
         page = await self.ensure_page()
         scroll_y = max(0, y - (self.viewport_height // 2))
         await page.evaluate(f"window.scrollTo({{top: {scroll_y}, behavior: 'smooth'}})")
-        await asyncio.sleep(1.0)
+        await self._stabilize("scroll")
 
     async def close(self):
-        if self.playwright: await self.playwright.stop()
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            self._refill_task = None
+        if self.storage_state and self.context is not None:
+            await self._save_storage_state()
+        # The browser outlives this session in the pool: close our own contexts explicitly
+        contexts = [c for c in (self.context, *(c for c, _ in self._context_pool)) if c is not None]
+        self._context_pool.clear()
+        # The CDP session dies with its page's context: no separate detach round trip
+        self._cdp = None
+        self._cdp_page = None
+        # Independent teardown steps run concurrently: shutdown costs the slowest, not the sum
+        teardown = []
+        if self._pending_writes:
+            # Let in-flight debug frames land before the loop goes away (bounded)
+            teardown.append(asyncio.wait(set(self._pending_writes), timeout=2.0))
+        if self.browser:
+            teardown.append(self._close_contexts(contexts))
+        await asyncio.gather(*teardown)
+        if self.browser:
+            await self._pool.release(self.browser)
+        self.browser = self.context = self.page = None
         logger.info("[BROWSER] Precision engine shutdown.")
 
+    @staticmethod
+    async def _close_contexts(contexts: List[BrowserContext]):
+        # Closing a context closes its pages; bounded so a dead session can't hang shutdown
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(c.close() for c in contexts), return_exceptions=True), timeout=3.0
+            )
+        except Exception as e:
+            logger.debug(f"[BROWSER] Context close skipped: {e}")
+
+    async def _save_storage_state(self):
+        """Snapshots cookies/localStorage so the next run starts logged in."""
+        try:
+            await self.context.storage_state(path=self.storage_state)
+            # Session tokens: owner-only
+            os.chmod(self.storage_state, 0o600)
+            self._context_options["storage_state"] = self.storage_state
+        except Exception as e:
+            logger.debug(f"[BROWSER] Storage state not saved: {e}")
+
     # --- New helpers: text search, click-by-text, dropdown selection ---
     async def find_text(self, text: str) -> bool:
         """Return True if `text` appears in page content (case-insensitive)."""
@@ -361,40 +1140,18 @@ class ArvynBrowser:
         # 0. Intelligent Locator First
         try:
             loc = page.get_by_text(text, exact=exact)
-            if await loc.count() > 0:
-                for i in range(await loc.count()):
-                    if await loc.nth(i).is_visible():
-                        await loc.nth(i).click(timeout=1000)
-                        return True
+            for i in range(await loc.count()):
+                item = loc.nth(i)
+                if await item.is_visible():
+                    await item.click(timeout=1000)
+                    return True
         except Exception:
             pass
 
-        # JS with fuzzy (Levenshtein) matcher to tolerate OCR/LLM variations
-        script = """
-            (t) => {
-                function levenshtein(a,b){if(!a||!b) return 1e9; a=a+'', b=b+''; const m=a.length, n=b.length; const d=[]; for(let i=0;i<=m;i++){d[i]=[i];} for(let j=1;j<=n;j++) d[0][j]=j; for(let i=1;i<=m;i++){for(let j=1;j<=n;j++){const cost = a[i-1]===b[j-1]?0:1; d[i][j]=Math.min(d[i-1][j]+1,d[i][j-1]+1,d[i-1][j-1]+cost);}} return d[m][n];}
-                const search = (t||'').toLowerCase().trim();
-                const elems = Array.from(document.querySelectorAll('a, button, [role="button"], span, div, label'));
-                let best=null; let bestScore=1e9;
-                for(const el of elems){
-                    const txt = (el.innerText||el.textContent||'').toLowerCase().trim();
-                    if(!txt) continue;
-                    if(txt.includes(search) && search.length>0){
-                        best = el; bestScore = 0; break;
-                    }
-                    const score = levenshtein(txt, search);
-                    if(score < bestScore && score <= Math.max(1, Math.floor(search.length*0.35))){ best=el; bestScore=score; }
-                }
-                if(best){ try{ best.scrollIntoView({behavior:'auto', block:'center'}); }catch(e){}
-                    try{ best.click(); }catch(e){ try{ best.dispatchEvent(new MouseEvent('click',{bubbles:true, cancelable:true})); }catch(e){} }
-                    return true;
-                }
-                return false;
-            }
-        """
+        # Fuzzy (Levenshtein) matcher tolerates OCR/LLM variations (see _CLICK_TEXT_JS)
         try:
             # try main frame
-            ok = await page.evaluate(script, text)
+            ok = await self._run_helper(page, "__arvynClickText", text)
             if ok: return True
         except Exception as e:
             logger.debug(f"[KINETIC] find_and_click_text main frame error: {e}")
@@ -404,7 +1161,7 @@ class ArvynBrowser:
             for frame in page.frames:
                 try:
                     if frame == page.main_frame: continue
-                    ok = await frame.evaluate(script, text)
+                    ok = await self._run_helper(frame, "__arvynClickText", text)
                     if ok: return True
                 except Exception:
                     continue
@@ -416,45 +1173,9 @@ class ArvynBrowser:
     async def select_option_by_text(self, select_hint: str, option_text: str) -> bool:
         """Find a <select> or menu matching `select_hint`, and choose option matching `option_text`."""
         page = await self.ensure_page()
-        # JS with fuzzy matching for options and menus
-        script = """
-            (params) => {
-                function levenshtein(a,b){if(!a||!b) return 1e9; a=a+'', b=b+''; const m=a.length, n=b.length; const d=[]; for(let i=0;i<=m;i++){d[i]=[i];} for(let j=1;j<=n;j++) d[0][j]=j; for(let i=1;i<=m;i++){for(let j=1;j<=n;j++){const cost = a[i-1]===b[j-1]?0:1; d[i][j]=Math.min(d[i-1][j]+1,d[i][j-1]+1,d[i-1][j-1]+cost);}} return d[m][n];}
-                const { hint, option } = params;
-                const search = (hint||'').toLowerCase().trim();
-                const opt = (option||'').toLowerCase().trim();
-                const selects = Array.from(document.querySelectorAll('select, [role="listbox"], [role="menu"]'));
-                for (const s of selects) {
-                    const label = (s.innerText||'').toLowerCase();
-                    if (!search || label.includes(search) || levenshtein(label, search) <= Math.max(1, Math.floor(search.length*0.35))) {
-                        // attempt native select
-                        if (s.tagName.toLowerCase() === 'select') {
-                            let best=null; let bestScore=1e9;
-                            for (const o of Array.from(s.options || [])) {
-                                const txt = (o.text||'').toLowerCase().trim();
-                                if(txt.includes(opt)) { s.value = o.value; s.dispatchEvent(new Event('change',{bubbles:true})); return true; }
-                                const score = levenshtein(txt, opt);
-                                if(score < bestScore){ bestScore = score; best = o; }
-                            }
-                            if(best && bestScore <= Math.max(1, Math.floor(opt.length*0.35))){ s.value = best.value; s.dispatchEvent(new Event('change',{bubbles:true})); return true; }
-                        }
-                        try { s.click(); } catch(e) {}
-                        const items = Array.from(document.querySelectorAll('[role="option"], [role="menuitem"], li'));
-                        let bestIt=null; let bestScore=1e9;
-                        for (const it of items) {
-                            const txt = (it.innerText||'').toLowerCase().trim();
-                            if(txt.includes(opt)) { try{ it.click(); }catch(e){ it.dispatchEvent(new MouseEvent('click',{bubbles:true})); } return true; }
-                            const score = levenshtein(txt, opt);
-                            if(score < bestScore){ bestScore = score; bestIt = it; }
-                        }
-                        if(bestIt && bestScore <= Math.max(1, Math.floor(opt.length*0.35))){ try{ bestIt.click(); }catch(e){ bestIt.dispatchEvent(new MouseEvent('click',{bubbles:true})); } return true; }
-                    }
-                }
-                return false;
-            }
-        """
+        params = {"hint": select_hint, "option": option_text}
         try:
-            ok = await page.evaluate(script, {"hint": select_hint, "option": option_text})
+            ok = await self._run_helper(page, "__arvynSelect", params)
             if ok: return True
         except Exception as e:
             logger.debug(f"[KINETIC] select_option_by_text main frame error: {e}")
@@ -462,7 +1183,9 @@ class ArvynBrowser:
         try:
             for frame in page.frames:
                 try:
-                    ok = await frame.evaluate(script, {"hint": select_hint, "option": option_text})
+                    # Main frame was already evaluated above
+                    if frame == page.main_frame: continue
+                    ok = await self._run_helper(frame, "__arvynSelect", params)
                     if ok: return True
                 except Exception:
                     continue
@@ -541,8 +1264,7 @@ class ArvynBrowser:
                     await page.keyboard.press("Control+A")
                     await page.keyboard.press("Backspace")
                     logger.info(f"[KINETIC] Typing email ({len(email)} chars)...")
-                    for char in email:
-                        await page.keyboard.type(char, delay=random.randint(30, 90))
+                    await page.keyboard.type(email, delay=random.randint(30, 90))
                     results['email'] = True
                 else:
                     # Fallback selectors - exclude password fields to prevent incorrect filling
@@ -565,9 +1287,9 @@ class ArvynBrowser:
             except Exception as e:
                 logger.error(f"[KINETIC] Email fill error: {e}")
 
-        # Short pause between fields
+        # Let the email field's handlers settle before moving on
         if results['email']:
-            await asyncio.sleep(0.5)
+            await self._stabilize("input")
 
         # 2. Fill Password
         if password:
@@ -577,8 +1299,7 @@ class ArvynBrowser:
                     await page.keyboard.press("Control+A")
                     await page.keyboard.press("Backspace")
                     logger.info(f"[KINETIC] Typing password...")
-                    for char in password:
-                        await page.keyboard.type(char, delay=random.randint(30, 90))
+                    await page.keyboard.type(password, delay=random.randint(30, 90))
                     results['password'] = True
                 else:
                     # Fallback selectors
@@ -630,16 +1351,23 @@ class ArvynBrowser:
                 await page.keyboard.press("Control+A")
                 await page.keyboard.press("Backspace")
                 logger.info(f"[KINETIC] Typing UPI ID...")
-                for char in upi_id:
-                    await page.keyboard.type(char, delay=random.randint(30, 90))
-                await asyncio.sleep(1.0)
+                await page.keyboard.type(upi_id, delay=random.randint(30, 90))
+                try:
+                    # Give async VPA validation time to enable Verify instead of clicking a disabled button
+                    await page.wait_for_function(_VERIFY_READY_JS, timeout=1500, polling=100)
+                except Exception:
+                    pass  # No Verify step on this form, or it stayed disabled
                 
                 # Check for Verify button and click if exists
                 await self.find_and_click_text("Verify")
 
             # 2. Find and fill UPI PIN
             if upi_pin:
-                await asyncio.sleep(0.5)
+                # Verification usually reveals the PIN field: wait for it rather than a fixed pause
+                try:
+                    await page.wait_for_function(_PIN_FIELD_JS, timeout=2000, polling=100)
+                except Exception:
+                    pass  # Fall through to the selector sweep below
                 pin_script = """
                     () => {
                         const inputs = Array.from(document.querySelectorAll('input'));
@@ -666,8 +1394,7 @@ class ArvynBrowser:
                             
                 if found_pin:
                      logger.info(f"[KINETIC] Typing UPI PIN...")
-                     for char in upi_pin:
-                        await page.keyboard.type(char, delay=random.randint(30, 90))
+                     await page.keyboard.type(upi_pin, delay=random.randint(30, 90))
         
             return True
         except Exception as e:
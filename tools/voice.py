@@ -1,22 +1,31 @@
 import pyttsx3
 import speech_recognition as sr
 import threading
+import queue
 import asyncio
+from PyQt6.QtCore import QObject, pyqtSignal
 from config import logger, DEFAULT_VOICE_ID, COMMAND_TIMEOUT
 
-class ArvynVoice:
+class ArvynVoice(QObject):
     """
     The sensory interface for Agent Arvyn (Production Grade).
     Refined as a thread-safe utility for TTS and secondary audio capture.
+    Emits `speech_finished` once a spoken utterance has fully played out.
+    The TTS engine lives on one long-lived worker thread: it is created there and every
+    utterance is fed to it through a queue (SAPI5 COM objects must stay on the thread
+    that created them). Speech requested during warm-up is spoken once it completes.
     """
+    speech_finished = pyqtSignal()
 
     def __init__(self):
-        self._lock = threading.Lock() 
+        super().__init__()
         self._is_speaking = False
         self.engine = None
+        self._ready = threading.Event()
+        self._utterances = queue.Queue()
         
-        # Initialize TTS Engine with error recovery
-        self._init_engine()
+        # The TTS thread initializes the engine with error recovery, off the caller's thread
+        threading.Thread(target=self._tts_loop, name="ArvynTTS", daemon=True).start()
 
         # Initialize Recognizer utility
         self.recognizer = sr.Recognizer()
@@ -24,8 +33,38 @@ class ArvynVoice:
         self.recognizer.pause_threshold = 0.5   
         logger.info("Voice Utility initialized.")
 
+    def _tts_loop(self):
+        """Owns the pyttsx3 engine: builds it, then speaks queued utterances one at a time."""
+        self._init_engine()
+        self._ready.set()
+        while True:
+            texts = [self._utterances.get()]
+            # Anything queued during warm-up goes out as one utterance
+            while not self._utterances.empty():
+                texts.append(self._utterances.get_nowait())
+            if not self.engine:
+                continue
+            self._is_speaking = True
+            try:
+                self.engine.say(" ".join(texts))
+                self.engine.runAndWait()
+            except Exception as e:
+                logger.error(f"TTS Thread Error: {e}")
+                # If the loop hangs, try re-initializing for next time
+                self._init_engine()
+            finally:
+                # Only this thread decides on overlap: whatever arrived mid-utterance is skipped
+                skipped = 0
+                while not self._utterances.empty():
+                    self._utterances.get_nowait()
+                    skipped += 1
+                if skipped:
+                    logger.warning("TTS was already active. Skipped %d overlapping utterance(s).", skipped)
+                self._is_speaking = False
+                self.speech_finished.emit()
+
     def _init_engine(self):
-        """Initializes or resets the pyttsx3 engine."""
+        """Initializes or resets the pyttsx3 engine. Runs only on the TTS thread."""
         try:
             self.engine = pyttsx3.init() if DEFAULT_VOICE_ID is None else pyttsx3.init(DEFAULT_VOICE_ID)
             self.engine.setProperty('rate', 185)
@@ -43,33 +82,13 @@ class ArvynVoice:
 
     def speak(self, text: str):
         """
-        Thread-safe speech synthesis.
-        Prevents 'run loop already started' by checking engine state and using a lock.
+        Thread-safe speech synthesis: hands the text to the TTS thread and returns at once.
+        Overlapping speech is skipped rather than queued behind the current utterance.
         """
-        if not text or not self.engine:
+        if not text:
             return
-        
-        def _run_tts():
-            # Acquire lock to ensure only one thread controls the pyttsx3 loop
-            if not self._lock.acquire(blocking=False):
-                logger.warning("TTS is already active. Skipping overlapping speech.")
-                return
-
-            self._is_speaking = True
-            try:
-                # We stop any pending speech before starting new one
-                self.engine.stop()
-                self.engine.say(text)
-                self.engine.runAndWait()
-            except Exception as e:
-                logger.error(f"TTS Thread Error: {e}")
-                # If the loop hangs, try re-initializing for next time
-                self._init_engine()
-            finally:
-                self._is_speaking = False
-                self._lock.release()
-
-        threading.Thread(target=_run_tts, daemon=True).start()
+        # Queued unconditionally; the TTS thread drops it if it overlaps an utterance in progress
+        self._utterances.put(text)
 
     async def listen(self) -> str:
         """
@@ -98,4 +117,9 @@ class ArvynVoice:
 
     @property
     def is_speaking(self):
-        return self._is_speaking
\ No newline at end of file
+        return self._is_speaking
+
+    @property
+    def is_available(self) -> bool:
+        """False only once warm-up has finished without a usable TTS engine."""
+        return not self._ready.is_set() or self.engine is not None
\ No newline at end of file